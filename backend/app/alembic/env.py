@@ -24,6 +24,7 @@ config.set_main_option("sqlalchemy.url", str(settings.SQLALCHEMY_DATABASE_URI))
 # This is critical for autogenerate to work properly
 from app.models.file import File  # noqa: E402, F401
 from app.models.item import Item  # noqa: E402, F401
+from app.models.submission import Submission, SubmissionDocument  # noqa: E402, F401
 from app.models.user import User  # noqa: E402, F401
 
 # Add your model's MetaData object here for 'autogenerate' support
@@ -51,6 +52,10 @@ def run_migrations_offline() -> None:
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
         compare_type=True,
+        # Index builds run in autocommit blocks, which commit the enclosing
+        # transaction; scope it to one revision so only that revision's
+        # work is committed early
+        transaction_per_migration=True,
     )
 
     with context.begin_transaction():
@@ -71,6 +76,7 @@ def run_migrations_online() -> None:
             connection=connection,
             target_metadata=target_metadata,
             compare_type=True,
+            transaction_per_migration=True,
         )
 
         with context.begin_transaction():
@@ -0,0 +1,44 @@
+"""Shared helpers for migration scripts."""
+
+from collections.abc import Iterator
+from contextlib import contextmanager, nullcontext
+
+from alembic import op
+
+
+@contextmanager
+def index_ddl_block() -> Iterator[None]:
+    """
+    Run index DDL outside the migration's transaction.
+
+    On dialects with transactional DDL (PostgreSQL) this commits the
+    surrounding migration transaction, runs the block in autocommit mode
+    and reopens the transaction afterwards, so a long index build holds
+    its locks only for itself. This is also required for
+    ``postgresql_concurrently=True``. Dialects without transactional DDL
+    already commit each statement, so the block runs as-is.
+
+    Raises:
+        RuntimeError: If migrations are not configured with
+            ``transaction_per_migration=True``; without it the commit would
+            also cover every earlier revision of the run, unstamped
+
+    Example:
+        with index_ddl_block():
+            op.create_index(
+                "ix_file_user_id", "file", ["user_id"],
+                postgresql_concurrently=True,
+            )
+    """
+    context = op.get_context()
+    if context.impl.transactional_ddl:
+        if not context.opts.get("transaction_per_migration"):
+            raise RuntimeError(
+                "index_ddl_block() requires transaction_per_migration=True "
+                "in context.configure()"
+            )
+        block = context.autocommit_block()
+    else:
+        block = nullcontext()
+    with block:
+        yield
@@ -10,6 +10,8 @@ from typing import Sequence, Union
 from alembic import op
 import sqlalchemy as sa
 
+from app.alembic.helpers import index_ddl_block
+
 
 # revision identifiers, used by Alembic.
 revision: str = '20260106_070400'
@@ -21,10 +23,14 @@ depends_on: Union[str, Sequence[str], None] = None
 def upgrade() -> None:
     """Add task_id column to file table."""
     op.add_column('file', sa.Column('task_id', sa.String(length=255), nullable=True))
-    op.create_index(op.f('ix_file_task_id'), 'file', ['task_id'], unique=False)
+    # Build the index outside the migration transaction so it commits on its
+    # own; on Postgres it is also built CONCURRENTLY (ignored elsewhere)
+    with index_ddl_block():
+        op.create_index(op.f('ix_file_task_id'), 'file', ['task_id'], unique=False, postgresql_concurrently=True)
 
 
 def downgrade() -> None:
     """Remove task_id column from file table."""
-    op.drop_index(op.f('ix_file_task_id'), table_name='file')
+    with index_ddl_block():
+        op.drop_index(op.f('ix_file_task_id'), table_name='file', postgresql_concurrently=True)
     op.drop_column('file', 'task_id')
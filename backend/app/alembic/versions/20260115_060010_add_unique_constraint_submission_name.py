@@ -9,6 +9,8 @@ from typing import Sequence, Union
 
 from alembic import op
 
+from app.alembic.helpers import index_ddl_block
+
 
 # revision identifiers, used by Alembic.
 revision: str = '20260115_060010'
@@ -19,11 +21,27 @@ depends_on: Union[str, Sequence[str], None] = None
 
 def upgrade() -> None:
     """Add unique constraint on (name, owner_id) for submission table."""
-    op.create_unique_constraint(
-        'uq_submission_name_owner',
-        'submission',
-        ['name', 'owner_id']
-    )
+    if op.get_context().dialect.name == 'postgresql':
+        # Build the backing unique index without blocking writes, then attach
+        # it as the constraint (a metadata-only change)
+        with index_ddl_block():
+            op.create_index(
+                'uq_submission_name_owner',
+                'submission',
+                ['name', 'owner_id'],
+                unique=True,
+                postgresql_concurrently=True,
+            )
+        op.execute(
+            'ALTER TABLE submission ADD CONSTRAINT uq_submission_name_owner '
+            'UNIQUE USING INDEX uq_submission_name_owner'
+        )
+    else:
+        op.create_unique_constraint(
+            'uq_submission_name_owner',
+            'submission',
+            ['name', 'owner_id']
+        )
 
 
 def downgrade() -> None:
@@ -0,0 +1,57 @@
+"""replace submission_document submission_id index with composite index
+
+Revision ID: 20260116_090000
+Revises: 20260115_060010
+Create Date: 2026-01-16 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.alembic.helpers import index_ddl_block
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20260116_090000'
+down_revision: Union[str, None] = '20260115_060010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index submission documents by (submission_id, uploaded_at)."""
+    # The composite index serves every submission_id lookup the single-column
+    # one did, and also returns a submission's documents in upload order
+    with index_ddl_block():
+        op.create_index(
+            'ix_submission_document_submission_uploaded',
+            'submission_document',
+            ['submission_id', 'uploaded_at'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+    with index_ddl_block():
+        op.drop_index(
+            op.f('ix_submission_document_submission_id'),
+            table_name='submission_document',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Restore the single-column submission_id index."""
+    with index_ddl_block():
+        op.create_index(
+            op.f('ix_submission_document_submission_id'),
+            'submission_document',
+            ['submission_id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+    with index_ddl_block():
+        op.drop_index(
+            'ix_submission_document_submission_uploaded',
+            table_name='submission_document',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,47 @@
+"""make file task_id index partial
+
+Revision ID: 20260116_093000
+Revises: 20260116_090000
+Create Date: 2026-01-16 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.alembic.helpers import index_ddl_block
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20260116_093000'
+down_revision: Union[str, None] = '20260116_090000'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Replace the file task_id index with one over non-null rows only."""
+    # Files uploaded outside a task never match a task_id lookup, so leave
+    # them out of the index. task_id is shared by all files of a task, so the
+    # index stays non-unique. Partial indexes are ignored on other dialects.
+    with index_ddl_block():
+        op.create_index(
+            'ix_file_task_id_not_null',
+            'file',
+            ['task_id'],
+            unique=False,
+            postgresql_concurrently=True,
+            postgresql_where=sa.text('task_id IS NOT NULL'),
+            sqlite_where=sa.text('task_id IS NOT NULL'),
+        )
+    with index_ddl_block():
+        op.drop_index(op.f('ix_file_task_id'), table_name='file', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Restore the full file task_id index."""
+    with index_ddl_block():
+        op.create_index(op.f('ix_file_task_id'), 'file', ['task_id'], unique=False, postgresql_concurrently=True)
+    with index_ddl_block():
+        op.drop_index('ix_file_task_id_not_null', table_name='file', postgresql_concurrently=True)
@@ -0,0 +1,43 @@
+"""store file ids as native uuid
+
+Revision ID: 20260116_100000
+Revises: 20260116_093000
+Create Date: 2026-01-16 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20260116_100000'
+down_revision: Union[str, None] = '20260116_093000'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Convert file.id from a string to a native uuid column."""
+    # Existing ids were generated with str(uuid4()), so the cast is lossless
+    op.alter_column(
+        'file',
+        'id',
+        existing_type=sa.String(),
+        type_=sa.Uuid(),
+        existing_nullable=False,
+        postgresql_using='id::uuid',
+    )
+
+
+def downgrade() -> None:
+    """Convert file.id back to a string column."""
+    op.alter_column(
+        'file',
+        'id',
+        existing_type=sa.Uuid(),
+        type_=sa.String(),
+        existing_nullable=False,
+        postgresql_using='id::text',
+    )
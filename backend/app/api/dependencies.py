@@ -5,15 +5,18 @@ Common dependencies used across endpoints.
 Organize by domain as the project grows.
 """
 
-from typing import Annotated
+import time
+from typing import Annotated, Any
 
 from fastapi import Depends, Header, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy.orm import make_transient_to_detached
 from sqlmodel import Session
 
+from app.core.cache import TTLCache
 from app.core.config import settings
 from app.core.database import get_session
-from app.core.security import decode_access_token
+from app.core.security import decode_access_token_payload
 from app.crud import user as user_crud
 from app.models.user import User
 
@@ -22,9 +25,128 @@ oauth2_scheme = OAuth2PasswordBearer(
     tokenUrl=f"{settings.API_V1_STR}/login/access-token"
 )
 
+
+async def _bearer(authorization: Annotated[str | None, Header()] = None) -> str:
+    """
+    Read a bearer token straight from the Authorization header.
+
+    Lighter than oauth2_scheme for internal endpoints that don't need the
+    OpenAPI security integration.
+
+    Args:
+        authorization: Authorization header value
+
+    Returns:
+        The raw bearer token
+
+    Raises:
+        HTTPException: If the header is missing or not a bearer token
+    """
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return token
+
+
 # Type aliases for dependency injection
 SessionDep = Annotated[Session, Depends(get_session)]
 TokenDep = Annotated[str, Depends(oauth2_scheme)]
+InternalTokenDep = Annotated[str, Depends(_bearer)]
+
+# Decoded token cache (token -> subject). Entries never outlive the token's
+# own expiry, so the TTL only bounds how long a decoded token is reused.
+TOKEN_CACHE_MAXSIZE = 10_000
+TOKEN_CACHE_TTL = 60.0
+
+_token_cache: TTLCache[str, str] = TTLCache(
+    maxsize=TOKEN_CACHE_MAXSIZE, ttl=TOKEN_CACHE_TTL
+)
+
+
+def _cached_decode(token: str) -> str | None:
+    """
+    Decode a JWT access token, reusing the result for repeated tokens.
+
+    Args:
+        token: JWT access token
+
+    Returns:
+        The token subject (user email), or None if the token is invalid
+    """
+    subject = _token_cache.get(token)
+    if subject is not None:
+        return subject
+
+    payload = decode_access_token_payload(token)
+    if payload is None:
+        return None
+
+    subject = str(payload.get("sub"))
+    expires_at = payload.get("exp")
+    ttl = float(expires_at) - time.time() if expires_at is not None else None
+    _token_cache.set(token, subject, ttl=ttl)
+    return subject
+
+
+# User row cache (email -> column snapshot). User-mutating routes call
+# invalidate_user(), but that only clears this worker's cache. The TTL is
+# therefore the security bound: on other workers a deactivated user or a
+# demoted superuser stays authorized for at most USER_CACHE_TTL seconds.
+USER_CACHE_MAXSIZE = 5_000
+USER_CACHE_TTL = 5.0
+
+_user_cache: TTLCache[str, dict[str, Any]] = TTLCache(
+    maxsize=USER_CACHE_MAXSIZE, ttl=USER_CACHE_TTL
+)
+
+
+def _get_user_by_email_cached(session: Session, email: str) -> User | None:
+    """
+    Get a user by email, skipping the SELECT for recently seen users.
+
+    Cached users are rebuilt from a column snapshot and attached to the
+    request session as persistent instances, so routes can update them
+    exactly as if they had been loaded from the database. If the session
+    already holds the user (e.g. resolved by another dependency of the
+    same request), that instance is returned instead.
+
+    Args:
+        session: Database session
+        email: User email address
+
+    Returns:
+        User instance if found, None otherwise
+    """
+    snapshot = _user_cache.get(email)
+    if snapshot is not None:
+        cached = User(**snapshot)
+        make_transient_to_detached(cached)
+        # merge() reuses an instance already in the identity map; load=False
+        # attaches without a SELECT
+        return session.merge(cached, load=False)
+
+    user = user_crud.get_user_by_email(session=session, email=email)
+    if user is not None:
+        _user_cache.set(email, user.model_dump())
+    return user
+
+
+def invalidate_user(email: str) -> None:
+    """
+    Drop a user from the authentication cache.
+
+    Call this after updating or deleting a user so the change is visible
+    on this worker's next request. Other workers pick it up once their
+    entry expires, after at most USER_CACHE_TTL seconds.
+
+    Args:
+        email: User email address
+    """
+    _user_cache.pop(email)
 
 
 def get_current_user(session: SessionDep, token: TokenDep) -> User:
@@ -41,7 +163,7 @@ def get_current_user(session: SessionDep, token: TokenDep) -> User:
     Raises:
         HTTPException: If token is invalid or user not found
     """
-    token_data = decode_access_token(token)
+    token_data = _cached_decode(token)
     if token_data is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -49,7 +171,7 @@ def get_current_user(session: SessionDep, token: TokenDep) -> User:
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    user = user_crud.get_user_by_email(session=session, email=token_data)
+    user = _get_user_by_email_cached(session, token_data)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -59,14 +181,16 @@ def get_current_user(session: SessionDep, token: TokenDep) -> User:
     return user
 
 
-def get_current_active_user(
-    current_user: Annotated[User, Depends(get_current_user)],
-) -> User:
+def get_current_active_user(session: SessionDep, token: TokenDep) -> User:
     """
     Get current active user.
 
+    Calls get_current_user directly rather than through Depends, which
+    keeps one node out of FastAPI's per-request dependency graph.
+
     Args:
-        current_user: Current authenticated user
+        session: Database session
+        token: JWT access token
 
     Returns:
         Current user if active
@@ -74,6 +198,7 @@ def get_current_active_user(
     Raises:
         HTTPException: If user is inactive
     """
+    current_user = get_current_user(session, token)
     if not current_user.is_active:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -82,14 +207,13 @@ def get_current_active_user(
     return current_user
 
 
-def get_current_active_superuser(
-    current_user: Annotated[User, Depends(get_current_user)],
-) -> User:
+def get_current_active_superuser(session: SessionDep, token: TokenDep) -> User:
     """
     Get current active superuser.
 
     Args:
-        current_user: Current authenticated user
+        session: Database session
+        token: JWT access token
 
     Returns:
         Current user if active superuser
@@ -97,6 +221,7 @@ def get_current_active_superuser(
     Raises:
         HTTPException: If user is not a superuser
     """
+    current_user = get_current_user(session, token)
     if not current_user.is_superuser:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -105,6 +230,23 @@ def get_current_active_superuser(
     return current_user
 
 
+def get_internal_superuser(session: SessionDep, token: InternalTokenDep) -> User:
+    """
+    Get current active superuser for internal endpoints.
+
+    Same checks as get_current_active_superuser, but the token is read
+    with the plain header reader instead of oauth2_scheme.
+
+    Args:
+        session: Database session
+        token: JWT access token
+
+    Returns:
+        Current user if active superuser
+    """
+    return get_current_active_superuser(session, token)
+
+
 # Type aliases for common user dependencies
 CurrentUser = Annotated[User, Depends(get_current_active_user)]
 CurrentSuperuser = Annotated[User, Depends(get_current_active_superuser)]
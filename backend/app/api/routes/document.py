@@ -8,12 +8,18 @@ Implements document processing and comparison endpoints using:
 """
 
 import asyncio
-from datetime import datetime
+from collections.abc import Iterator
+from datetime import datetime, timezone
+from io import BytesIO
+from typing import Any
 
-from fastapi import APIRouter, BackgroundTasks, status
+import anyio
+from fastapi import APIRouter, BackgroundTasks, Response, status
+from pydantic import BaseModel
 
+from app.core.config import settings
 from app.core.constants import Tags
-from app.core.context_managers import multiple_temp_files_context
+from app.core.context_managers import temp_files_cleanup_context
 from app.core.logging import get_logger
 from app.exceptions import NotFoundException, ServiceUnavailableException
 from app.schemas.document import (
@@ -22,12 +28,19 @@ from app.schemas.document import (
     DocumentSubmissionRequest,
     DocumentSubmissionResponse,
 )
-from app.services.document_processor import document_processor
+from app.services.document_comparison import (
+    classify_input_documents,
+    compare_document_pair_optimized,
+    load_document_set,
+)
+from app.services.document_processor import IN_MEMORY_TYPES, document_processor
 from app.services.field_comparison_service import field_comparison_service
 from app.services.storage_service import storage_service
 
 logger = get_logger(__name__)
 
+UTC = timezone.utc
+
 router = APIRouter(prefix="/document", tags=[Tags.DOCUMENT])
 
 
@@ -44,13 +57,14 @@ router = APIRouter(prefix="/document", tags=[Tags.DOCUMENT])
 async def process_document_submission(
     payload: DocumentSubmissionRequest,
     background_tasks: BackgroundTasks,
-) -> DocumentSubmissionResponse:
+) -> Response:
     """
     Process document submission with field extraction and comparison.
 
     Flow:
-    1. Load files from MinIO (download to temp)
-    2. Process each file (Excel parsing or LLM OCR for PDF)
+    1. List files in MinIO for the task
+    2. Download and process each file (Excel parsing or LLM OCR for PDF),
+       at most DOC_OCR_CONCURRENCY files at a time
     3. Extract structured fields
     4. Compare fields across documents
     5. Save OCR results to MinIO
@@ -69,113 +83,159 @@ async def process_document_submission(
     task_id = payload.task_id
 
     # Step 1: List files
-    files = await storage_service.list_files(task_id)
-    if not files:
-        raise NotFoundException(
-            f"No files found for task_id: {task_id}",
-            resource=f"task:{task_id}",
-        )
-
-    logger.info(f"Processing {len(files)} files for task {task_id}")
-
-    # Filter out OCR results file
-    files_to_process = [
-        f for f in files if not f["name"].endswith("ocr_results.json")
-    ]
-
+    # Skips the OCR results file written by a previous run
+    files_to_process = await storage_service.list_processable_files(task_id)
     if not files_to_process:
         raise NotFoundException(
-            f"No processable files found for task_id: {task_id}",
+            f"No files found for task_id: {task_id}",
             resource=f"task:{task_id}",
         )
 
-    # Step 2: Process files in parallel with proper resource management
-    processing_tasks = []
-    temp_file_paths: list[str] = []
-
-    try:
-        # Download all files first
-        for file_info in files_to_process:
-            temp_path = await storage_service.download_file_to_temp(file_info["name"])
-            temp_file_paths.append(temp_path)
-
-        # Create processing tasks
-        for idx, file_info in enumerate(files_to_process):
-            task = document_processor.process_file_from_path(
-                temp_file_paths[idx],
-                file_info["name"],
-            )
-            processing_tasks.append(task)
-
-        # Wait for all processing to complete
-        document_results = await asyncio.gather(
-            *processing_tasks, return_exceptions=True
-        )
-    except Exception as e:
-        logger.error(f"Error processing documents for task {task_id}: {e}", exc_info=e)
+    logger.info(f"Processing {len(files_to_process)} files for task {task_id}")
+
+    # Step 2: Download and process files with a fixed pool of workers
+    # pulling from a shared iterator, so large tasks never schedule one
+    # coroutine per file. The task group cancels any in-flight OCR calls if
+    # the request itself is cancelled, instead of leaving them running
+    # detached.
+    pending = iter(enumerate(files_to_process))
+    results: list[dict[str, Any] | None] = [None] * len(files_to_process)
+    # Identical files in the submission (e.g. dropped in twice) share one OCR run
+    inflight: dict[str, asyncio.Task[dict[str, Any]]] = {}
+    if len(files_to_process) == 1:
+        # Nothing to overlap; skip the task group for single-file submissions
+        await _submission_worker(pending, results, inflight)
+    else:
+        num_workers = min(settings.DOC_OCR_CONCURRENCY, len(files_to_process))
+        async with anyio.create_task_group() as task_group:
+            for _ in range(num_workers):
+                task_group.start_soon(_submission_worker, pending, results, inflight)
+
+    # Results stay in listing order so comparisons are deterministic
+    valid_results = [result for result in results if result is not None]
+    if not valid_results:
         raise ServiceUnavailableException(
-            f"Failed to process documents: {str(e)}",
+            "Failed to process any documents",
             service="document_processor",
-        ) from e
-    finally:
-        # Clean up temp files using context manager pattern
-        for temp_path in temp_file_paths:
-            try:
-                import os
-
-                if os.path.exists(temp_path):
-                    os.unlink(temp_path)
-            except Exception as e:
-                logger.warning(f"Failed to delete temp file {temp_path}: {e}")
-
-        # Handle errors
-        valid_results = []
-        for idx, result in enumerate(document_results):
-            if isinstance(result, Exception):
-                logger.error(
-                    f"Error processing {files[idx]['name']}: {result}",
-                    exc_info=result,
-                )
-                continue
-            valid_results.append(result)
-
-        if not valid_results:
-            raise ServiceUnavailableException(
-                "Failed to process any documents",
-                service="document_processor",
-            )
-
-        # Step 3: Compare fields
-        comparison_result = field_comparison_service.compare_documents(valid_results)
-
-        # Step 4: Save OCR results to MinIO
-        ocr_results = {
-            "task_id": task_id,
-            "document_results": valid_results,
-            "comparison_result": comparison_result,
-            "processed_at": datetime.utcnow().isoformat(),
-        }
-
-        # Save in background
-        background_tasks.add_task(
-            storage_service.save_ocr_result,
-            task_id,
-            ocr_results,
         )
 
-        # Return results
-        return DocumentSubmissionResponse(
+    # Step 3: Compare fields
+    comparison_result = field_comparison_service.compare_documents(valid_results)
+
+    # Step 4: Save OCR results to MinIO
+    ocr_results = {
+        "task_id": task_id,
+        "document_results": valid_results,
+        "comparison_result": comparison_result,
+        "processed_at": datetime.now(UTC).isoformat(timespec="microseconds"),
+    }
+
+    # Save in background
+    background_tasks.add_task(
+        storage_service.save_ocr_result,
+        task_id,
+        ocr_results,
+    )
+
+    # Return results
+    return _json_response(
+        DocumentSubmissionResponse(
             status="processed",
             result={
                 "task_id": task_id,
                 "documents_processed": len(valid_results),
                 "comparison": comparison_result,
             },
-        )
+        ),
+        status.HTTP_202_ACCEPTED,
+    )
 
     # Exceptions are handled by global exception handlers
 
 
+def _json_response(model: BaseModel, status_code: int) -> Response:
+    """
+    Serialize a response model straight to JSON bytes.
+
+    Pydantic's serializer skips FastAPI's jsonable_encoder pass and
+    json.dumps, which dominate for large comparison payloads. The route's
+    response_model still documents the schema.
+
+    Args:
+        model: Response model instance
+        status_code: HTTP status code
+
+    Returns:
+        JSON response with the serialized model
+    """
+    return Response(
+        content=model.model_dump_json(),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+async def _submission_worker(
+    pending: Iterator[tuple[int, dict[str, Any]]],
+    results: list[dict[str, Any] | None],
+    inflight: dict[str, asyncio.Task[dict[str, Any]]],
+) -> None:
+    """
+    Process submission files until the shared iterator is exhausted.
+
+    Args:
+        pending: Shared iterator of (index, file metadata) pairs
+        results: Result slots, one per listed file
+        inflight: Submission-wide OCR tasks keyed by content
+    """
+    for idx, file_info in pending:
+        await _process_submission_file(idx, file_info, results, inflight)
+
+
+async def _process_submission_file(
+    idx: int,
+    file_info: dict[str, Any],
+    results: list[dict[str, Any] | None],
+    inflight: dict[str, asyncio.Task[dict[str, Any]]],
+) -> None:
+    """
+    Download and process a single submission file.
+
+    Small Excel/PDF files are read into memory; everything else goes
+    through a temp file. Errors are logged and leave a None result so one
+    bad file doesn't fail the batch.
+
+    Args:
+        idx: Position of the file in the task listing
+        file_info: File metadata from storage_service.list_files
+        results: Result slots, one per listed file; filled at ``idx``
+        inflight: Submission-wide OCR tasks keyed by content, so duplicate
+            files are only OCR'd once
+    """
+    object_name = file_info["name"]
+    async with temp_files_cleanup_context() as temp_files:
+        try:
+            source: str | BytesIO
+            if (
+                file_info["size"] <= settings.DOC_IN_MEMORY_MAX_BYTES
+                and document_processor.detect_file_type(object_name)
+                in IN_MEMORY_TYPES
+            ):
+                source = await storage_service.get_file_stream(object_name)
+            else:
+                source = await storage_service.download_file_to_temp(
+                    object_name, file_info["size"]
+                )
+                temp_files.append(source)
+            results[idx] = await document_processor.process_file_cached(
+                source,
+                object_name,
+                inflight=inflight,
+            )
+        except Exception as e:
+            logger.error(f"Error processing {object_name}: {e}", exc_info=e)
+
+
 @router.post(
     "/compare_document_contents",
     response_model=CompareDocumentResponse,
@@ -188,13 +248,13 @@ async def process_document_submission(
 )
 async def compare_document_contents(
     payload: CompareDocumentRequest,
-) -> CompareDocumentResponse:
+) -> Response:
     """
     Compare Excel and PDF documents using visual OCR comparison.
 
     Optimized Flow:
     1. Load document set from MinIO to local directory
-    2. Classify documents by pattern matching (concurrent with comparison prep)
+    2. Classify documents by pattern matching
     3. Compare documents with parallel page processing
     4. Return result_images with status code 201
 
@@ -213,13 +273,6 @@ async def compare_document_contents(
     Raises:
         HTTPException: If comparison fails
     """
-    from app.services.document_comparison import (
-        classify_input_documents,
-        compare_document_pair_optimized,
-        load_document_set,
-    )
-    import asyncio
-
     task_id = payload.task_id.strip()
     excel_file_name = payload.excel_file_name.strip()
     pdf_file_name = payload.pdf_file_name.strip()
@@ -234,26 +287,32 @@ async def compare_document_contents(
         task_dir = await load_document_set(task_id)
         logger.info(f"Loaded document set to: {task_dir}")
 
-        # Step 2: Classify input documents (concurrent with other operations)
+        # Step 2: Classify input documents off the event loop. This must
+        # finish before the comparison starts, since the comparison renames
+        # the Excel file and writes the converted PDF and page images into
+        # the same task directory
         classified_docs = await asyncio.to_thread(classify_input_documents, task_id)
         logger.info(f"Classified documents: {classified_docs}")
 
-        # Step 3: Compare document pair with optimized parallel processing
+        # Step 3: Compare documents
         result_images = await compare_document_pair_optimized(
             task_id, excel_file_name, pdf_file_name
         )
         logger.info(f"Generated {len(result_images)} result images")
 
         # Return result_images with status 201
-        return CompareDocumentResponse(
-            status="compared",
-            result={
-                "task_id": task_id,
-                "excel_file": excel_file_name,
-                "pdf_file": pdf_file_name,
-                "classified_documents": classified_docs,
-                "result_images": result_images,
-            },
+        return _json_response(
+            CompareDocumentResponse(
+                status="compared",
+                result={
+                    "task_id": task_id,
+                    "excel_file": excel_file_name,
+                    "pdf_file": pdf_file_name,
+                    "classified_documents": classified_docs,
+                    "result_images": result_images,
+                },
+            ),
+            status.HTTP_201_CREATED,
         )
     except FileNotFoundError as e:
         logger.error(f"File not found: {e}", exc_info=e)
@@ -11,23 +11,27 @@ Implements file CRUD operations:
 """
 
 import os
-from pathlib import Path
+from urllib.parse import quote
 from uuid import UUID
 
 from fastapi import (
     APIRouter,
     File,
+    Header,
     HTTPException,
     Query,
+    Response,
     UploadFile,
     status,
 )
-from fastapi.responses import FileResponse
+from fastapi.responses import StreamingResponse
 
 from app.api.dependencies import CurrentUser, SessionDep
 from app.core.constants import Tags
 from app.core.logging import get_logger
+from app.core.temp_pool import temp_file_pool
 from app.crud import file as file_crud
+from app.models.file import File as FileModel
 from app.models.submission import Submission, SubmissionDocument
 from app.schemas.file import (
     FileDeleteResponse,
@@ -45,23 +49,29 @@ logger = get_logger(__name__)
 router = APIRouter(prefix="/files", tags=[Tags.FILES])
 
 # Supported file types
-SUPPORTED_EXTENSIONS = {
-    ".xlsx",
-    ".xls",
-    ".pdf",
-    ".doc",
-    ".docx",
-    ".png",
-    ".jpg",
-    ".jpeg",
-    ".bmp",
-    ".tiff",
-    ".gif",
-}
+SUPPORTED_EXTENSIONS = frozenset(
+    {
+        ".xlsx",
+        ".xls",
+        ".pdf",
+        ".doc",
+        ".docx",
+        ".png",
+        ".jpg",
+        ".jpeg",
+        ".bmp",
+        ".tiff",
+        ".gif",
+    }
+)
 
 # Max file size: 50MB
 MAX_FILE_SIZE = 50 * 1024 * 1024
 
+# Largest request body accepted by upload_file: the file plus room for the
+# multipart boundaries, part headers and the task_id query string
+MAX_UPLOAD_BODY_SIZE = MAX_FILE_SIZE + 64 * 1024
+
 
 def validate_file(file: UploadFile) -> None:
     """
@@ -79,13 +89,75 @@ def validate_file(file: UploadFile) -> None:
             detail="Filename is required",
         )
 
-    ext = Path(file.filename).suffix.lower()
+    ext = os.path.splitext(file.filename)[1].lower()
     if ext not in SUPPORTED_EXTENSIONS:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Unsupported file type: {ext}. Supported: {', '.join(SUPPORTED_EXTENSIONS)}",
         )
 
+    # The multipart parser records the size while spooling, so oversized
+    # uploads are rejected before anything is streamed to MinIO
+    if file.size is not None and file.size > MAX_FILE_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File too large. Maximum size is {MAX_FILE_SIZE // (1024 * 1024)}MB",
+        )
+
+
+def _content_disposition(filename: str) -> str:
+    """
+    Build an attachment Content-Disposition header, as FileResponse does.
+
+    Args:
+        filename: Download file name
+
+    Returns:
+        Header value, RFC 5987-encoded for non-ASCII names
+    """
+    quoted = quote(filename)
+    if quoted != filename:
+        return f"attachment; filename*=utf-8''{quoted}"
+    return f'attachment; filename="{filename}"'
+
+
+def _file_etag(file_data: FileModel) -> str:
+    """
+    Build a weak ETag for a file record.
+
+    Args:
+        file_data: File record
+
+    Returns:
+        ETag that changes whenever the record is updated
+    """
+    return f'W/"{int(file_data.updated_at.timestamp() * 1_000_000)}"'
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag.
+
+    The header may list several tags or be ``*``. Tags are compared weakly,
+    as If-None-Match requires, so a ``W/`` prefix on either side is ignored.
+
+    Args:
+        if_none_match: If-None-Match header value, if any
+        etag: Current ETag of the resource
+
+    Returns:
+        True if the client's cached copy is still current
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque_tag = etag.removeprefix("W/")
+    return any(
+        tag.strip().removeprefix("W/") == opaque_tag
+        for tag in if_none_match.split(",")
+    )
+
 
 @router.post(
     "/upload",
@@ -157,7 +229,7 @@ async def upload_file(
             )
 
             return FileUploadResponse(
-                file_id=file_data.id,
+                file_id=str(file_data.id),
                 filename=file_data.filename,
                 file_type=file_data.file_type,
                 file_size=file_data.file_size,
@@ -201,11 +273,10 @@ async def upload_file(
             file_size=file_metadata["file_size"],
             content_type=file_metadata["content_type"],
         )
-        session.add(doc)
 
-        # Also create File record for backward compatibility
-        file_data = file_crud.create(
-            session=session,
+        # Also create File record for backward compatibility; both rows are
+        # inserted in a single commit
+        file_data = file_crud.build(
             user_id=current_user.id,
             filename=file_metadata["file_name"],
             file_type=document_processor.detect_file_type(file_metadata["file_name"]),
@@ -214,10 +285,13 @@ async def upload_file(
             task_id=task_id,
         )
 
+        session.add_all([doc, file_data])
         session.commit()
+        session.refresh(file_data)
+        logger.info(f"Created file record: {file_data.id}")
 
         return FileUploadResponse(
-            file_id=file_data.id,
+            file_id=str(file_data.id),
             filename=file_data.filename,
             file_type=file_data.file_type,
             file_size=file_data.file_size,
@@ -254,9 +328,11 @@ async def list_files(
     try:
         files = file_crud.list_by_user(session=session, user_id=current_user.id)
 
+        # Rows come straight from the database with the schema's types, so
+        # per-row validation is skipped
         file_infos = [
-            FileInfo(
-                file_id=f.id,
+            FileInfo.model_construct(
+                file_id=str(f.id),
                 user_id=f.user_id,
                 filename=f.filename,
                 file_type=f.file_type,
@@ -286,16 +362,26 @@ async def list_files(
     description="Get details of a specific file.",
 )
 async def get_file(
-    file_id: str, session: SessionDep, current_user: CurrentUser
-) -> FileInfo:
+    file_id: str,
+    session: SessionDep,
+    current_user: CurrentUser,
+    response: Response,
+    if_none_match: str | None = Header(None),
+) -> FileInfo | Response:
     """
     Get file details.
 
+    Supports conditional requests: the response carries an ETag derived
+    from the record's updated_at, and a matching If-None-Match gets an
+    empty 304 instead of the full body.
+
     Args:
         file_id: File ID
+        response: Response used to set caching headers
+        if_none_match: ETags from previous responses, if any
 
     Returns:
-        FileInfo with file details
+        FileInfo with file details, or 304 Not Modified
     """
     try:
         file_data = file_crud.get(session=session, file_id=file_id)
@@ -312,8 +398,20 @@ async def get_file(
                 detail="Access denied",
             )
 
+        # Checked after the ownership check, so a 304 reveals nothing
+        etag = _file_etag(file_data)
+        cache_headers = {
+            "ETag": etag,
+            "Cache-Control": "private, max-age=0, must-revalidate",
+        }
+        if _etag_matches(if_none_match, etag):
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers
+            )
+        response.headers.update(cache_headers)
+
         return FileInfo(
-            file_id=file_data.id,
+            file_id=str(file_data.id),
             user_id=file_data.user_id,
             filename=file_data.filename,
             file_type=file_data.file_type,
@@ -341,7 +439,7 @@ async def get_file(
 )
 async def download_file(
     file_id: str, session: SessionDep, current_user: CurrentUser
-) -> FileResponse:
+) -> StreamingResponse:
     """
     Download a file.
 
@@ -349,9 +447,8 @@ async def download_file(
         file_id: File ID
 
     Returns:
-        FileResponse with file content
+        StreamingResponse with file content
     """
-    temp_path = None
     try:
         file_data = file_crud.get(session=session, file_id=file_id)
         if not file_data:
@@ -367,25 +464,22 @@ async def download_file(
                 detail="Access denied",
             )
 
-        # Download from MinIO to temp file
-        temp_path = await storage_service.download_file_to_temp(file_data.object_name)
-
-        return FileResponse(
-            path=temp_path,
-            filename=file_data.filename,
+        # Stream the object straight from MinIO; no local copy is made
+        stream = await storage_service.open_object_stream(file_data.object_name)
+        return StreamingResponse(
+            stream,
             media_type="application/octet-stream",
+            headers={
+                "Content-Disposition": _content_disposition(file_data.filename),
+                # The size is known up front, so clients can show progress
+                "Content-Length": str(file_data.file_size),
+            },
         )
 
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"Error downloading file: {e}", exc_info=e)
-        # Clean up temp file on error
-        if temp_path:
-            try:
-                os.unlink(temp_path)
-            except Exception:
-                pass
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to download file: {str(e)}",
@@ -485,7 +579,9 @@ async def process_file(
             )
 
         # Download file to temp
-        temp_path = await storage_service.download_file_to_temp(file_data.object_name)
+        temp_path = await storage_service.download_file_to_temp(
+            file_data.object_name, file_data.file_size
+        )
 
         # Process file
         result = await document_processor.process_file_from_path(
@@ -511,7 +607,4 @@ async def process_file(
     finally:
         # Clean up temp file
         if temp_path:
-            try:
-                os.unlink(temp_path)
-            except Exception as e:
-                logger.warning(f"Failed to delete temp file {temp_path}: {e}")
+            temp_file_pool.release(temp_path)
@@ -6,8 +6,8 @@ from fastapi import APIRouter, HTTPException, status
 
 from app.api.dependencies import CurrentUser, SessionDep
 from app.crud import item as item_crud
+from app.schemas.common import Message
 from app.schemas.item import ItemCreate, ItemPublic, ItemsPublic, ItemUpdate
-from app.schemas.user import Message
 
 router = APIRouter(prefix="/items", tags=["items"])
 
@@ -21,12 +21,12 @@ def read_items(
     """
     if current_user.is_superuser:
         # Superusers can see all items
-        from sqlmodel import select
+        from sqlmodel import func, select
 
         from app.models.item import Item
 
-        count_statement = select(Item)
-        count = len(session.exec(count_statement).all())
+        count_statement = select(func.count()).select_from(Item)
+        count = session.exec(count_statement).one()
 
         statement = select(Item).offset(skip).limit(limit)
         items = session.exec(statement).all()
@@ -5,13 +5,16 @@ from typing import Any
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from app.api.dependencies import (
+    CurrentSuperuser,
     CurrentUser,
     SessionDep,
     get_current_active_superuser,
+    get_internal_superuser,
+    invalidate_user,
 )
 from app.crud import user as user_crud
+from app.schemas.common import Message
 from app.schemas.user import (
-    Message,
     PrivateUserCreate,
     UpdatePassword,
     UserCreate,
@@ -77,6 +80,7 @@ def delete_user_me(session: SessionDep, current_user: CurrentUser) -> Any:
             detail="Super users are not allowed to delete themselves",
         )
     user_crud.delete_user(session=session, user_id=current_user.id)
+    invalidate_user(current_user.email)
     return Message(message="User deleted successfully")
 
 
@@ -98,9 +102,13 @@ def update_user_me(
             )
 
     user_data = user_in.model_dump(exclude_unset=True)
+    old_email = current_user.email
     current_user.sqlmodel_update(user_data)
     session.add(current_user)
     session.commit()
+    # Invalidate only once committed, so a concurrent request can't re-cache
+    # the old row in between
+    invalidate_user(old_email)
     session.refresh(current_user)
     return current_user
 
@@ -125,6 +133,7 @@ def update_password_me(
         db_user=current_user,
         user_in=UserUpdate(password=body.new_password),
     )
+    invalidate_user(current_user.email)
     return Message(message="Password updated successfully")
 
 
@@ -192,13 +201,15 @@ def update_user(
                 detail="User with this email already exists",
             )
 
+    old_email = db_user.email
     db_user = user_crud.update_user(session=session, db_user=db_user, user_in=user_in)
+    invalidate_user(old_email)
     return db_user
 
 
-@router.delete("/{user_id}", dependencies=[Depends(get_current_active_superuser)])
+@router.delete("/{user_id}")
 def delete_user(
-    session: SessionDep, current_user: CurrentUser, user_id: str
+    session: SessionDep, current_user: CurrentSuperuser, user_id: str
 ) -> Message:
     """
     Delete a user.
@@ -209,12 +220,13 @@ def delete_user(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found",
         )
-    if user == current_user:
+    if user.id == current_user.id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Super users are not allowed to delete themselves",
         )
     user_crud.delete_user(session=session, user_id=user_id)
+    invalidate_user(user.email)
     return Message(message="User deleted successfully")
 
 
@@ -223,7 +235,7 @@ private_router = APIRouter(prefix="/private/users", tags=["private"])
 
 
 @private_router.post(
-    "/", dependencies=[Depends(get_current_active_superuser)], response_model=UserPublic
+    "/", dependencies=[Depends(get_internal_superuser)], response_model=UserPublic
 )
 def create_user_private(*, session: SessionDep, user_in: PrivateUserCreate) -> Any:
     """
@@ -0,0 +1,104 @@
+"""
+In-process caching utilities.
+
+Provides a small bounded TTL cache for hot-path lookups (token decoding,
+user rows, etc.) without pulling in an external caching dependency.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    Thread-safe LRU cache with per-entry time-to-live.
+
+    Entries expire after ``ttl`` seconds (or a shorter per-entry TTL passed
+    to ``set``). When ``maxsize`` is reached the least recently used entry
+    is evicted.
+
+    Example:
+        cache: TTLCache[str, int] = TTLCache(maxsize=100, ttl=60)
+        cache.set("key", 1)
+        cache.get("key")  # -> 1
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        Initialize cache.
+
+        Args:
+            maxsize: Maximum number of entries kept in the cache
+            ttl: Default time-to-live in seconds for each entry
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[K, tuple[V, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> V | None:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: K, value: V, ttl: float | None = None) -> None:
+        """
+        Store a value in the cache.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Optional TTL override in seconds (capped at the default TTL)
+        """
+        entry_ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if entry_ttl <= 0:
+            return
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + entry_ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: K) -> V | None:
+        """
+        Remove a value from the cache.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The removed value, or None if it was not cached
+        """
+        with self._lock:
+            entry = self._data.pop(key, None)
+        return entry[0] if entry else None
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
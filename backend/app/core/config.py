@@ -77,6 +77,14 @@ class Settings(BaseSettings):
     MINIO_SECRET_KEY: str = "minioadmin"
     MINIO_SECURE: bool = False
     MINIO_BUCKET: str = "documents"
+    # Threads for blocking MinIO calls; the HTTP connection pool is sized to match
+    MINIO_MAX_WORKERS: int = 10
+    # Max objects downloaded at once when loading a task's document set
+    MINIO_DOWNLOAD_CONCURRENCY: int = 8
+    # Objects at least this large are downloaded as concurrent ranged GETs
+    MINIO_RANGED_DOWNLOAD_THRESHOLD: int = 64 * 1024 * 1024
+    MINIO_RANGED_DOWNLOAD_CHUNK_SIZE: int = 8 * 1024 * 1024
+    MINIO_RANGED_DOWNLOAD_CONCURRENCY: int = 4  # Keep low to avoid 503 SlowDown
 
     # OpenAI Settings (for LLM OCR)
     OPENAI_API_KEY: str = ""
@@ -91,6 +99,15 @@ class Settings(BaseSettings):
     # MinIO Output Bucket for processed images
     MINIO_OUTPUT_BUCKET: str = "vpas-output"
 
+    # Document processing
+    DOC_OCR_CONCURRENCY: int = 8  # Max files downloaded/OCR'd at once per request
+    DOC_OCR_CACHE_ENABLED: bool = True  # Reuse OCR output for identical files
+    DOC_IN_MEMORY_MAX_BYTES: int = 32 * 1024 * 1024  # Larger files go via temp files
+
+    # Requests declaring a larger Content-Length are rejected before the
+    # body is read
+    MAX_REQUEST_BODY_SIZE: int = 200 * 1024 * 1024
+
     # Rate Limiting
     RATE_LIMIT_ENABLED: bool = True
     RATE_LIMIT_PER_MINUTE: int = 60
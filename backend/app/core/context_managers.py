@@ -5,12 +5,14 @@ Provides safe resource handling with automatic cleanup.
 """
 
 import os
+import shutil
 import tempfile
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import AsyncIterator
 
 from app.core.logging import get_logger
+from app.core.temp_pool import temp_file_pool
 
 logger = get_logger(__name__)
 
@@ -44,13 +46,13 @@ async def temp_file_context(
     try:
         temp_fd, temp_path = tempfile.mkstemp(suffix=suffix, prefix=prefix)
         os.close(temp_fd)  # Close file descriptor, we'll use path
-        logger.debug(f"Created temp file: {temp_path}")
+        logger.debug("Created temp file: %s", temp_path)
         yield temp_path
     finally:
         if delete and temp_path and os.path.exists(temp_path):
             try:
                 os.unlink(temp_path)
-                logger.debug(f"Deleted temp file: {temp_path}")
+                logger.debug("Deleted temp file: %s", temp_path)
             except Exception as e:
                 logger.warning(f"Failed to delete temp file {temp_path}: {e}")
 
@@ -85,15 +87,13 @@ async def temp_directory_context(
         temp_dir = Path(
             tempfile.mkdtemp(suffix=suffix, prefix=prefix)
         )
-        logger.debug(f"Created temp directory: {temp_dir}")
+        logger.debug("Created temp directory: %s", temp_dir)
         yield temp_dir
     finally:
         if delete and temp_dir and temp_dir.exists():
             try:
-                import shutil
-
                 shutil.rmtree(temp_dir)
-                logger.debug(f"Deleted temp directory: {temp_dir}")
+                logger.debug("Deleted temp directory: %s", temp_dir)
             except Exception as e:
                 logger.warning(f"Failed to delete temp directory {temp_dir}: {e}")
 
@@ -123,22 +123,47 @@ async def multiple_temp_files_context(
             pass
         # All files automatically deleted
     """
-    temp_files: list[str] = []
-
-    try:
+    async with temp_files_cleanup_context(delete=delete) as temp_files:
         for i in range(count):
             temp_fd, temp_path = tempfile.mkstemp(suffix=suffix, prefix=prefix)
             os.close(temp_fd)
             temp_files.append(temp_path)
-            logger.debug(f"Created temp file {i+1}/{count}: {temp_path}")
+            logger.debug("Created temp file %d/%d: %s", i + 1, count, temp_path)
+
+        yield temp_files
+
+
+@asynccontextmanager
+async def temp_files_cleanup_context(
+    delete: bool = True,
+) -> AsyncIterator[list[str]]:
+    """
+    Context manager that deletes temp files registered while it is open.
 
+    For files created elsewhere (e.g. by storage_service downloads): append
+    each path as soon as it exists and it is released on exit, even if a
+    later step fails. Files from temp_file_pool go back to the pool; any
+    other file is deleted.
+
+    Args:
+        delete: Whether to delete files on exit
+
+    Yields:
+        List to append temp file paths to
+
+    Example:
+        async with temp_files_cleanup_context() as temp_files:
+            temp_files.append(await storage_service.download_file_to_temp(name))
+            ...
+        # Registered files automatically deleted
+    """
+    temp_files: list[str] = []
+
+    try:
         yield temp_files
     finally:
         if delete:
             for temp_path in temp_files:
-                if os.path.exists(temp_path):
-                    try:
-                        os.unlink(temp_path)
-                        logger.debug(f"Deleted temp file: {temp_path}")
-                    except Exception as e:
-                        logger.warning(f"Failed to delete temp file {temp_path}: {e}")
+                # Pooled files are truncated for reuse, others are unlinked
+                temp_file_pool.release(temp_path)
+                logger.debug("Released temp file: %s", temp_path)
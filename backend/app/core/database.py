@@ -40,6 +40,7 @@ def init_db() -> None:
     # Import all models here to ensure they are registered with SQLModel
     from app.models.file import File  # noqa: F401
     from app.models.item import Item  # noqa: F401
+    from app.models.submission import Submission, SubmissionDocument  # noqa: F401
     from app.models.user import User  # noqa: F401
 
     SQLModel.metadata.create_all(engine)
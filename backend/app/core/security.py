@@ -65,6 +65,25 @@ def get_password_hash(password: str) -> str:
     return str(pwd_context.hash(password))
 
 
+def decode_access_token_payload(token: str) -> dict[str, Any] | None:
+    """
+    Decode and verify a JWT access token, returning all claims.
+
+    Args:
+        token: The JWT token to decode
+
+    Returns:
+        The decoded token claims, or None if invalid
+    """
+    try:
+        payload: dict[str, Any] = jwt.decode(
+            token, settings.SECRET_KEY, algorithms=[ALGORITHM]
+        )
+        return payload
+    except jwt.PyJWTError:
+        return None
+
+
 def decode_access_token(token: str) -> str | None:
     """
     Decode and verify a JWT access token.
@@ -75,8 +94,7 @@ def decode_access_token(token: str) -> str | None:
     Returns:
         The subject (user identifier) from the token, or None if invalid
     """
-    try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[ALGORITHM])
-        return str(payload.get("sub"))
-    except jwt.PyJWTError:
+    payload = decode_access_token_payload(token)
+    if payload is None:
         return None
+    return str(payload.get("sub"))
@@ -0,0 +1,115 @@
+"""
+Reusable temp file pool.
+
+Downloads for processing each need a scratch file that only lives for the
+duration of a request. Instead of creating and unlinking a fresh temp file
+every time, released files are truncated and kept on a per-suffix free list
+so the next download reuses the same inode.
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Released files kept per suffix; anything beyond this is unlinked
+TEMP_POOL_MAX_FREE_PER_SUFFIX = 16
+
+
+class TempFilePool:
+    """
+    Thread-safe LIFO pool of reusable temp files.
+
+    Files are created in a private directory and keyed by suffix, since
+    some readers (e.g. openpyxl) dispatch on the file extension. Released
+    files are truncated rather than unlinked; paths not owned by the pool
+    are simply deleted, so ``release`` is safe to call on any temp file.
+
+    Example:
+        path = temp_file_pool.acquire(".pdf")
+        try:
+            ...  # write and read path
+        finally:
+            temp_file_pool.release(path)
+    """
+
+    def __init__(self, max_free_per_suffix: int = TEMP_POOL_MAX_FREE_PER_SUFFIX):
+        """
+        Initialize pool.
+
+        Args:
+            max_free_per_suffix: Maximum released files kept per suffix
+        """
+        self.max_free_per_suffix = max_free_per_suffix
+        self._dir: Path | None = None
+        self._free: dict[str, list[str]] = {}
+        self._lock = threading.Lock()
+
+    def _pool_dir(self) -> Path:
+        """Return the pool directory, creating it on first use."""
+        if self._dir is None or not self._dir.exists():
+            self._dir = Path(tempfile.mkdtemp(prefix="temp-pool-"))
+        return self._dir
+
+    def acquire(self, suffix: str = "") -> str:
+        """
+        Get an empty temp file.
+
+        Args:
+            suffix: File suffix (e.g. '.pdf')
+
+        Returns:
+            Path to an empty file owned by the caller until released
+        """
+        with self._lock:
+            free = self._free.get(suffix)
+            if free:
+                return free.pop()
+            pool_dir = self._pool_dir()
+        temp_fd, temp_path = tempfile.mkstemp(suffix=suffix, dir=pool_dir)
+        os.close(temp_fd)
+        return temp_path
+
+    def release(self, path: str) -> None:
+        """
+        Return a temp file to the pool, or delete it.
+
+        Files outside the pool directory, or beyond the free-list limit,
+        are unlinked. Missing files (e.g. moved elsewhere by the caller)
+        are ignored.
+
+        Args:
+            path: Path previously returned by acquire, or any temp file
+        """
+        suffix = Path(path).suffix
+        with self._lock:
+            owned = self._dir is not None and Path(path).parent == self._dir
+            free = self._free.setdefault(suffix, [])
+            keep = owned and len(free) < self.max_free_per_suffix
+            try:
+                if keep:
+                    os.truncate(path, 0)
+                    free.append(path)
+                else:
+                    os.unlink(path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Failed to release temp file {path}: {e}")
+
+    def close(self) -> None:
+        """Delete all pooled files and the pool directory."""
+        with self._lock:
+            self._free.clear()
+            if self._dir is not None:
+                shutil.rmtree(self._dir, ignore_errors=True)
+                self._dir = None
+
+
+# Singleton instance
+temp_file_pool = TempFilePool()
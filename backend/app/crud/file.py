@@ -6,6 +6,7 @@ Database-backed CRUD operations for file metadata.
 
 from datetime import datetime
 from typing import Any
+from uuid import UUID
 
 from sqlmodel import Session, select
 
@@ -15,6 +16,47 @@ from app.models.file import File
 logger = get_logger(__name__)
 
 
+def build(
+    *,
+    user_id: str,
+    filename: str,
+    file_type: str,
+    file_size: int,
+    object_name: str,
+    task_id: str | None = None,
+) -> File:
+    """
+    Build a new, unsaved file record.
+
+    Lets callers add it to a session together with related rows and
+    commit them at once.
+
+    Args:
+        user_id: ID of the user uploading the file
+        filename: Original filename
+        file_type: Detected file type
+        file_size: File size in bytes
+        object_name: Object name in MinIO
+        task_id: Optional task ID for document processing
+
+    Returns:
+        Unsaved File instance
+    """
+    # One timestamp for both fields, so a new record's updated_at matches
+    # its uploaded_at exactly
+    now = datetime.utcnow()
+    return File(
+        user_id=user_id,
+        filename=filename,
+        file_type=file_type,
+        file_size=file_size,
+        object_name=object_name,
+        task_id=task_id,
+        uploaded_at=now,
+        updated_at=now,
+    )
+
+
 def create(
     *,
     session: Session,
@@ -40,7 +82,7 @@ def create(
     Returns:
         File instance
     """
-    db_obj = File(
+    db_obj = build(
         user_id=user_id,
         filename=filename,
         file_type=file_type,
@@ -66,7 +108,13 @@ def get(*, session: Session, file_id: str) -> File | None:
     Returns:
         File instance if found, None otherwise
     """
-    return session.get(File, file_id)
+    # IDs are stored as native UUIDs; anything that does not parse as one
+    # cannot match a row
+    try:
+        key = UUID(file_id)
+    except ValueError:
+        return None
+    return session.get(File, key)
 
 
 def list_by_user(*, session: Session, user_id: str) -> list[File]:
@@ -110,7 +158,7 @@ def delete(*, session: Session, file_id: str) -> bool:
     Returns:
         True if deleted, False if not found
     """
-    file = session.get(File, file_id)
+    file = get(session=session, file_id=file_id)
     if file:
         session.delete(file)
         session.commit()
@@ -131,7 +179,7 @@ def update(*, session: Session, file_id: str, **kwargs: Any) -> File | None:
     Returns:
         Updated File instance or None if not found
     """
-    file = session.get(File, file_id)
+    file = get(session=session, file_id=file_id)
     if not file:
         return None
 
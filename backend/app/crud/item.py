@@ -1,6 +1,6 @@
 """CRUD operations for Item model."""
 
-from sqlmodel import Session, select
+from sqlmodel import Session, func, select
 
 from app.models.item import Item
 from app.schemas.item import ItemCreate, ItemUpdate
@@ -78,8 +78,10 @@ def get_items(
     Returns:
         Tuple of (list of items, total count)
     """
-    count_statement = select(Item).where(Item.owner_id == owner_id)
-    count = len(session.exec(count_statement).all())
+    count_statement = (
+        select(func.count()).select_from(Item).where(Item.owner_id == owner_id)
+    )
+    count = session.exec(count_statement).one()
 
     statement = select(Item).where(Item.owner_id == owner_id).offset(skip).limit(limit)
     items = session.exec(statement).all()
@@ -1,6 +1,6 @@
 """CRUD operations for User model."""
 
-from sqlmodel import Session, select
+from sqlmodel import Session, func, select
 
 from app.core.security import get_password_hash, verify_password
 from app.models.user import User
@@ -122,8 +122,8 @@ def get_users(
     Returns:
         Tuple of (list of users, total count)
     """
-    count_statement = select(User)
-    count = len(session.exec(count_statement).all())
+    count_statement = select(func.count()).select_from(User)
+    count = session.exec(count_statement).one()
 
     statement = select(User).offset(skip).limit(limit)
     users = session.exec(statement).all()
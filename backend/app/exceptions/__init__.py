@@ -97,6 +97,22 @@ class RateLimitException(AppException):
         )
 
 
+class PayloadTooLargeException(AppException):
+    """Exception raised when a request body exceeds the allowed size."""
+
+    def __init__(
+        self,
+        message: str = "Request body too large",
+        max_bytes: int | None = None,
+    ):
+        details = {"max_bytes": max_bytes} if max_bytes else {}
+        super().__init__(
+            message,
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            details=details,
+        )
+
+
 async def app_exception_handler(_request: Request, exc: AppException) -> JSONResponse:
     """
     Handle application-specific exceptions.
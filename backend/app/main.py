@@ -1,3 +1,4 @@
+import asyncio
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 
@@ -6,9 +7,11 @@ from fastapi.routing import APIRoute
 from starlette.middleware.cors import CORSMiddleware
 
 from app.api.main import api_router
+from app.api.routes.files import MAX_UPLOAD_BODY_SIZE
 from app.core.config import settings
 from app.core.constants import Environment
 from app.core.logging import get_logger, setup_logging
+from app.core.temp_pool import temp_file_pool
 from app.exceptions import (
     AppException,
     RateLimitException,
@@ -16,7 +19,9 @@ from app.exceptions import (
     generic_exception_handler,
 )
 from app.middleware import RequestLoggingMiddleware
+from app.middleware.content_size import ContentSizeLimitMiddleware
 from app.middleware.rate_limit import RateLimitMiddleware
+from app.services.storage_service import storage_service
 
 # Setup logging
 setup_logging()
@@ -39,6 +44,12 @@ async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
     logger.info(f"Environment: {settings.ENVIRONMENT}")
     logger.info(f"API docs: http://localhost:8000{settings.API_V1_STR}/docs")
 
+    # Run new tasks eagerly (Python 3.12+) so gathered coroutines that finish
+    # without suspending, e.g. cache hits, skip a trip through the event loop
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+        logger.info("Eager task factory enabled")
+
     # Initialize database in local environment (for development only)
     # In production, use Alembic migrations instead
     if settings.ENVIRONMENT == Environment.LOCAL:
@@ -77,6 +88,8 @@ async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
 
     # Shutdown
     logger.info(f"Shutting down {settings.PROJECT_NAME}")
+    storage_service.close()
+    temp_file_pool.close()
 
 
 app = FastAPI(
@@ -104,6 +117,15 @@ if settings.RATE_LIMIT_ENABLED:
         enabled=True,
     )
 
+# Reject oversized uploads before their body is read
+app.add_middleware(
+    ContentSizeLimitMiddleware,
+    max_body_size=settings.MAX_REQUEST_BODY_SIZE,
+    # Single-file uploads are capped at the file size limit, not the
+    # general request limit
+    path_limits={f"{settings.API_V1_STR}/files/upload": MAX_UPLOAD_BODY_SIZE},
+)
+
 # Set all CORS enabled origins
 if settings.all_cors_origins:
     app.add_middleware(
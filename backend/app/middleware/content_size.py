@@ -0,0 +1,82 @@
+"""
+Request body size limiting middleware.
+
+Rejects oversized requests from their headers, before the body is read.
+"""
+
+from collections.abc import Awaitable, Callable, Mapping
+
+from fastapi import Request, Response
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp
+
+from app.core.logging import get_logger
+from app.exceptions import PayloadTooLargeException, app_exception_handler
+
+logger = get_logger(__name__)
+
+
+class ContentSizeLimitMiddleware(BaseHTTPMiddleware):
+    """
+    Reject requests whose declared Content-Length exceeds a limit.
+
+    Multipart uploads are otherwise parsed and spooled in full before a
+    route can look at them, so an oversized upload would be transferred
+    and written to disk only to be rejected afterwards. Routes with a
+    tighter limit of their own (e.g. single-file uploads) can be given a
+    per-path override.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        max_body_size: int,
+        path_limits: Mapping[str, int] | None = None,
+    ) -> None:
+        """
+        Initialize content size limiting middleware.
+
+        Args:
+            app: FastAPI application
+            max_body_size: Maximum request body size in bytes
+            path_limits: Per-path maximum body sizes, overriding
+                max_body_size for exact path matches
+        """
+        super().__init__(app)
+        self.max_body_size = max_body_size
+        self.path_limits = dict(path_limits or {})
+
+    async def dispatch(
+        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
+    ) -> Response:
+        """
+        Check the request's Content-Length before handling it.
+
+        Args:
+            request: The incoming request
+            call_next: The next middleware or route handler
+
+        Returns:
+            413 response if the body is too large, otherwise the response
+            from the next handler
+        """
+        content_length = request.headers.get("content-length")
+        if content_length and content_length.isdigit():
+            max_body_size = self.path_limits.get(
+                request.url.path, self.max_body_size
+            )
+            if int(content_length) > max_body_size:
+                logger.warning(
+                    f"Rejected {request.method} {request.url.path}: "
+                    f"body of {content_length} bytes exceeds {max_body_size}"
+                )
+                # Raised exceptions would bypass the app's exception handlers
+                # from here, so the error response is built directly
+                return await app_exception_handler(
+                    request,
+                    PayloadTooLargeException(
+                        "Request body too large", max_bytes=max_body_size
+                    ),
+                )
+
+        return await call_next(request)
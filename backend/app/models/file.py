@@ -1,8 +1,9 @@
 """File database model."""
 
 from datetime import datetime
-from uuid import uuid4
+from uuid import UUID, uuid4
 
+from sqlalchemy import Index, text
 from sqlmodel import Field, SQLModel
 
 
@@ -14,9 +15,19 @@ class File(SQLModel, table=True):
     Stores file metadata and references to MinIO objects.
     """
 
-    id: str = Field(default_factory=lambda: str(uuid4()), primary_key=True)
+    __table_args__ = (
+        # Only files attached to a task are ever looked up by task_id
+        Index(
+            "ix_file_task_id_not_null",
+            "task_id",
+            postgresql_where=text("task_id IS NOT NULL"),
+            sqlite_where=text("task_id IS NOT NULL"),
+        ),
+    )
+
+    id: UUID = Field(default_factory=uuid4, primary_key=True)
     user_id: str = Field(index=True, max_length=255)
-    task_id: str | None = Field(default=None, index=True, max_length=255)
+    task_id: str | None = Field(default=None, max_length=255)
     filename: str = Field(max_length=255)
     file_type: str = Field(max_length=50)
     file_size: int
@@ -3,7 +3,7 @@
 from datetime import datetime
 from uuid import UUID, uuid4
 
-from sqlalchemy import Column, DateTime, func
+from sqlalchemy import Column, DateTime, Index, UniqueConstraint, func
 from sqlmodel import Field, Relationship, SQLModel
 
 
@@ -15,9 +15,16 @@ class SubmissionDocument(SQLModel, table=True):
     """
 
     __tablename__ = "submission_document"
+    __table_args__ = (
+        Index(
+            "ix_submission_document_submission_uploaded",
+            "submission_id",
+            "uploaded_at",
+        ),
+    )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    submission_id: UUID = Field(foreign_key="submission.id", index=True)
+    submission_id: UUID = Field(foreign_key="submission.id")
     file_name: str = Field(max_length=255)
     file_path: str = Field(max_length=500)
     file_size: int
@@ -38,6 +45,9 @@ class Submission(SQLModel, table=True):
     """
 
     __tablename__ = "submission"
+    __table_args__ = (
+        UniqueConstraint("name", "owner_id", name="uq_submission_name_owner"),
+    )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     name: str = Field(max_length=255)
@@ -49,4 +59,7 @@ class Submission(SQLModel, table=True):
     )
 
     # Relationship
-    documents: list["SubmissionDocument"] = Relationship(back_populates="submission")
+    documents: list["SubmissionDocument"] = Relationship(
+        back_populates="submission",
+        sa_relationship_kwargs={"order_by": "SubmissionDocument.uploaded_at"},
+    )
@@ -3,6 +3,9 @@
 from pydantic import EmailStr
 from sqlmodel import Field, SQLModel
 
+# Re-exported for backward compatibility; defined once in schemas.common
+from app.schemas.common import Message  # noqa: F401
+
 
 # Shared properties
 class UserBase(SQLModel):
@@ -76,13 +79,6 @@ class UserRead(UserBase):
     id: str
 
 
-# Generic message
-class Message(SQLModel):
-    """Generic message response."""
-
-    message: str
-
-
 # Token schemas
 class Token(SQLModel):
     """JWT token response."""
@@ -28,14 +28,18 @@ External services:
 
 import asyncio
 import base64
+import hashlib
+import json
 import os
 import re
+import shutil
 import subprocess
 import time
 from pathlib import Path
 from typing import Any
 
 import cv2
+import fitz  # type: ignore[import-untyped]  # PyMuPDF
 import numpy as np
 from openai import OpenAI
 from pdf2image import convert_from_path
@@ -50,54 +54,224 @@ logger = get_logger(__name__)
 # Base path for document storage
 BASE_DOCUMENT_PATH = Path("/tmp/documents")
 
+# Optional single-archive upload of a task's files, used instead of
+# downloading each object when present
+TASK_BUNDLE_FILENAME = "bundle.tar"
+
+# Bump when extract_OCR_texts_2's prompt or parsing changes, so cached page
+# OCR results from the old version are not reused
+VLM_OCR_VERSION = "1"
+
+# Minimum characters in a PDF's embedded text layer for it to be used
+# instead of VLM OCR
+TEXT_LAYER_MIN_CHARS = 20
+
+# Texts and (x, y, width, height) pixel boxes found on one page image
+PageTexts = tuple[list[str], list[tuple[int, int, int, int]]]
+
+# Extensions and name keywords used by classify_input_documents
+EXCEL_EXTENSIONS = frozenset({".XLSX", ".XLS"})
+PO_SO_KEYWORDS = ("PO", "SO", "PC", "SC")
+
+# Per-task subdirectory holding the ETag of each downloaded object
+ETAG_DIR_NAME = ".etags"
+
+# In-progress load_document_set calls by task_id
+_loading_tasks: dict[str, asyncio.Task[Path]] = {}
+
 
 async def load_document_set(task_id: str) -> Path:
     """
     Load document set from MinIO storage to local directory.
 
     Downloads all files associated with a task_id from MinIO bucket
-    to a local directory structure.
+    to a local directory structure. If the task has a bundle.tar object,
+    it is extracted instead and the individual objects are ignored; its
+    files are expected at the archive root, like the flat task layout.
+
+    Concurrent calls for the same task share a single load, and files
+    whose local copy is current are not downloaded again.
 
     Args:
         task_id: Unique identifier for the task
 
     Returns:
-        Path to the local directory containing downloaded files
+        Path to the local directory containing downloaded files (not
+        created if the task has no files)
 
     Raises:
         Exception: If download fails
     """
-    logger.info(f"Loading document set for task_id: {task_id}")
+    task = _loading_tasks.get(task_id)
+    if task is None:
+        task = asyncio.ensure_future(_load_document_set(task_id))
+        _loading_tasks[task_id] = task
+        task.add_done_callback(lambda _: _loading_tasks.pop(task_id, None))
+    # Shielded so one cancelled caller doesn't abort the load for the others
+    return await asyncio.shield(task)
+
+
+async def _load_document_set(task_id: str) -> Path:
+    """
+    Download a task's document set (see load_document_set).
+
+    Args:
+        task_id: Unique identifier for the task
+
+    Returns:
+        Path to the local directory containing downloaded files
+    """
+    logger.info("Loading document set for task_id: %s", task_id)
 
-    # Create local directory for task
     task_dir = BASE_DOCUMENT_PATH / task_id
-    task_dir.mkdir(parents=True, exist_ok=True)
 
-    # List all files in MinIO for this task
-    files = await storage_service.list_files(task_id)
+    # List all files in MinIO for this task (the OCR results file is never
+    # classified, so don't download it)
+    files = await storage_service.list_processable_files(task_id)
 
     if not files:
-        logger.warning(f"No files found for task_id: {task_id}")
+        logger.warning("No files found for task_id: %s", task_id)
+        return task_dir
+
+    # Create local directory for task only once there is something to write
+    await asyncio.to_thread(task_dir.mkdir, parents=True, exist_ok=True)
+
+    # A task packed as a single archive is fetched in one GET instead of
+    # one per file
+    bundle_name = f"{task_id}/{TASK_BUNDLE_FILENAME}"
+    bundle = next((f for f in files if f["name"] == bundle_name), None)
+    if bundle is not None:
+        await _extract_bundle_to_task_dir(bundle, task_dir)
         return task_dir
 
-    # Download each file
-    for file_info in files:
-        object_name = file_info["name"]
-        # Extract just the filename without the task_id prefix
-        filename = object_name.split("/")[-1]
-        local_path = task_dir / filename
+    # Download files concurrently (each download is an independent MinIO
+    # round-trip), capped so large tasks don't queue every download on the
+    # storage thread pool at once
+    semaphore = asyncio.Semaphore(settings.MINIO_DOWNLOAD_CONCURRENCY)
 
-        # Download file to local path
-        temp_path = await storage_service.download_file_to_temp(object_name)
-        # Move from temp to task directory
-        import shutil
+    async def download(file_info: dict[str, Any]) -> Path:
+        async with semaphore:
+            return await _download_to_task_dir(file_info, task_dir)
 
-        shutil.move(temp_path, local_path)
-        logger.info(f"Downloaded {filename} to {local_path}")
+    await asyncio.gather(*(download(file_info) for file_info in files))
 
     return task_dir
 
 
+async def _download_to_task_dir(file_info: dict[str, Any], task_dir: Path) -> Path:
+    """
+    Download a single MinIO object into the task directory.
+
+    The object's ETag is recorded next to the download, so a later call for
+    the same task skips objects whose local copy is still current.
+
+    Args:
+        file_info: Object metadata from storage_service.list_files
+        task_dir: Local task directory
+
+    Returns:
+        Path to the downloaded file
+    """
+    # Extract just the filename without the task_id prefix
+    filename: str = file_info["name"].rpartition("/")[2]
+    local_path = task_dir / filename
+    etag_path = task_dir / ETAG_DIR_NAME / filename
+
+    if await asyncio.to_thread(
+        _is_local_copy_current, local_path, etag_path, file_info
+    ):
+        logger.info("Skipping download of %s, local copy is current", filename)
+        return local_path
+
+    # Download file to temp, then move into the task directory
+    temp_path = await storage_service.download_file_to_temp(
+        file_info["name"], file_info["size"]
+    )
+    await asyncio.to_thread(shutil.move, temp_path, local_path)
+    if file_info.get("etag"):
+        await asyncio.to_thread(_record_etag, etag_path, file_info["etag"])
+    logger.info("Downloaded %s to %s", filename, local_path)
+    return local_path
+
+
+async def _extract_bundle_to_task_dir(
+    bundle_info: dict[str, Any], task_dir: Path
+) -> None:
+    """
+    Extract a task's bundle archive into the task directory.
+
+    Skipped when the bundle's ETag matches the one recorded at the last
+    extraction.
+
+    Args:
+        bundle_info: Bundle object metadata from storage_service.list_files
+        task_dir: Local task directory
+    """
+    etag = bundle_info.get("etag")
+    etag_path = task_dir / ETAG_DIR_NAME / TASK_BUNDLE_FILENAME
+    if etag and await asyncio.to_thread(_read_etag, etag_path) == etag:
+        logger.info("Skipping extraction of %s, unchanged", bundle_info["name"])
+        return
+
+    await storage_service.extract_tar_object(bundle_info["name"], str(task_dir))
+    if etag:
+        await asyncio.to_thread(_record_etag, etag_path, etag)
+    logger.info("Extracted %s to %s", bundle_info["name"], task_dir)
+
+
+def _is_local_copy_current(
+    local_path: Path, etag_path: Path, file_info: dict[str, Any]
+) -> bool:
+    """
+    Check whether a previously downloaded file still matches its object.
+
+    Args:
+        local_path: Local copy of the object
+        etag_path: Sidecar file holding the ETag recorded at download time
+        file_info: Current object metadata from storage_service.list_files
+
+    Returns:
+        True if the local size and recorded ETag match the object
+    """
+    etag = file_info.get("etag")
+    if not isinstance(etag, str) or not etag:
+        return False
+    try:
+        if local_path.stat().st_size != file_info["size"]:
+            return False
+    except OSError:
+        return False
+    return _read_etag(etag_path) == etag
+
+
+def _read_etag(etag_path: Path) -> str | None:
+    """
+    Read an ETag recorded by _record_etag.
+
+    Args:
+        etag_path: Sidecar file holding the ETag
+
+    Returns:
+        The recorded ETag, or None if there is none
+    """
+    try:
+        return etag_path.read_text()
+    except OSError:
+        return None
+
+
+def _record_etag(etag_path: Path, etag: str) -> None:
+    """
+    Record the ETag of a downloaded object.
+
+    Args:
+        etag_path: Sidecar file to write
+        etag: Object ETag
+    """
+    etag_path.parent.mkdir(exist_ok=True)
+    etag_path.write_text(etag)
+
+
 def classify_input_documents(task_id: str) -> dict[str, str | list[str]]:
     """
     Classify documents in a task directory by pattern matching.
@@ -118,65 +292,66 @@ def classify_input_documents(task_id: str) -> dict[str, str | list[str]]:
         - export_CD_file_name: Export CD (contains "TKX", .XLSX/.XLS, can be list)
         - PO_SO_file_name: PO/SO (contains "PO"/"SO"/"PC"/"SC", .XLSX/.XLS)
     """
-    logger.info(f"Classifying documents for task_id: {task_id}")
+    logger.info("Classifying documents for task_id: %s", task_id)
 
     task_dir = BASE_DOCUMENT_PATH / task_id
-    if not task_dir.exists():
-        logger.warning(f"Task directory not found: {task_dir}")
+    try:
+        # DirEntry.is_file() uses the type from the directory listing, so
+        # no per-file stat or Path objects are needed
+        with os.scandir(task_dir) as entries:
+            filenames = [entry.name for entry in entries if entry.is_file()]
+    except FileNotFoundError:
+        logger.warning("Task directory not found: %s", task_dir)
         return {}
 
     result: dict[str, str | list[str]] = {}
     export_cd_files: list[str] = []
 
     # Scan directory
-    for file_path in task_dir.iterdir():
-        if not file_path.is_file():
-            continue
-
-        filename = file_path.name
+    for filename in filenames:
         filename_upper = filename.upper()
-        file_ext = file_path.suffix.upper()
+        file_ext = os.path.splitext(filename_upper)[1]
 
         # Classify by pattern
-        if "SETTLE" in filename_upper and file_ext in [".XLSX", ".XLS"]:
+        if "SETTLE" in filename_upper and file_ext in EXCEL_EXTENSIONS:
             result["settle_file_name"] = filename
-            logger.info(f"Classified as settle: {filename}")
+            logger.info("Classified as settle: %s", filename)
 
         elif ("VAT" in filename_upper or "E-INV" in filename_upper) and file_ext == ".XML":
             result["einvoice_file_name"] = filename
-            logger.info(f"Classified as e-invoice: {filename}")
+            logger.info("Classified as e-invoice: %s", filename)
 
-        elif "CI&PKL" in filename_upper and file_ext in [".XLSX", ".XLS"]:
+        elif "CI&PKL" in filename_upper and file_ext in EXCEL_EXTENSIONS:
             result["cinvoice_plist_file_name"] = filename
-            logger.info(f"Classified as CI&PKL: {filename}")
+            logger.info("Classified as CI&PKL: %s", filename)
 
-        elif "CI" in filename_upper and file_ext in [".XLSX", ".XLS"]:
+        elif "CI" in filename_upper and file_ext in EXCEL_EXTENSIONS:
             # Check if not already classified as CI&PKL
             if "cinvoice_plist_file_name" not in result or result["cinvoice_plist_file_name"] != filename:
                 result["cinvoice_file_name"] = filename
-                logger.info(f"Classified as commercial invoice: {filename}")
+                logger.info("Classified as commercial invoice: %s", filename)
 
-        elif "PKL" in filename_upper and file_ext in [".XLSX", ".XLS"]:
+        elif "PKL" in filename_upper and file_ext in EXCEL_EXTENSIONS:
             # Check if not already classified as CI&PKL
             if "cinvoice_plist_file_name" not in result or result["cinvoice_plist_file_name"] != filename:
                 result["packing_list_file_name"] = filename
-                logger.info(f"Classified as packing list: {filename}")
+                logger.info("Classified as packing list: %s", filename)
 
-        elif "TKX" in filename_upper and file_ext in [".XLSX", ".XLS"]:
+        elif "TKX" in filename_upper and file_ext in EXCEL_EXTENSIONS:
             export_cd_files.append(filename)
-            logger.info(f"Classified as export CD: {filename}")
+            logger.info("Classified as export CD: %s", filename)
 
-        elif any(
-            keyword in filename_upper for keyword in ["PO", "SO", "PC", "SC"]
-        ) and file_ext in [".XLSX", ".XLS"]:
+        elif file_ext in EXCEL_EXTENSIONS and any(
+            keyword in filename_upper for keyword in PO_SO_KEYWORDS
+        ):
             result["PO_SO_file_name"] = filename
-            logger.info(f"Classified as PO/SO: {filename}")
+            logger.info("Classified as PO/SO: %s", filename)
 
     # Add export CD files (can be multiple)
     if export_cd_files:
         result["export_CD_file_name"] = export_cd_files
 
-    logger.info(f"Classification result: {result}")
+    logger.info("Classification result: %s", result)
     return result
 
 
@@ -231,13 +406,17 @@ def convert_excel_to_pdf(excel_path: Path) -> Path:
         raise
 
 
-def export_pdf_to_images(pdf_path: Path, dpi: int = 200) -> tuple[list[Path], int]:
+def export_pdf_to_images(
+    pdf_path: Path, dpi: int = 200, crop: bool = True
+) -> tuple[list[Path], int]:
     """
     Export PDF pages to JPG images using pdf2image.
 
     Args:
         pdf_path: Path to the PDF file
         dpi: Resolution for image conversion (default: 200)
+        crop: Crop each page to its non-white content. Disable to keep
+            page coordinates, e.g. for extract_pdf_text_layer boxes.
 
     Returns:
         Tuple of (list of image file paths, number of pages)
@@ -271,7 +450,7 @@ def export_pdf_to_images(pdf_path: Path, dpi: int = 200) -> tuple[list[Path], in
                 | (image_array[:, :, 2] < 250)
             )
 
-            if len(non_white[0]) > 0 and len(non_white[1]) > 0:
+            if crop and len(non_white[0]) > 0 and len(non_white[1]) > 0:
                 # Crop to content
                 y_min, y_max = non_white[0].min(), non_white[0].max()
                 x_min, x_max = non_white[1].min(), non_white[1].max()
@@ -381,7 +560,6 @@ def extract_OCR_texts_2(image_path: Path) -> tuple[list[str], list[tuple[int, in
             else:
                 json_str = content
 
-        import json
         ocr_results = json.loads(json_str)
 
         texts: list[str] = []
@@ -411,6 +589,115 @@ def extract_OCR_texts_2(image_path: Path) -> tuple[list[str], list[tuple[int, in
         raise
 
 
+def extract_pdf_text_layer(pdf_path: Path, dpi: int = 200) -> list[PageTexts] | None:
+    """
+    Extract words and bounding boxes from a PDF's embedded text layer.
+
+    Boxes are scaled to pixels of an uncropped render at ``dpi`` (see
+    export_pdf_to_images with crop=False).
+
+    Args:
+        pdf_path: Path to the PDF file
+        dpi: Resolution the page images are rendered at
+
+    Returns:
+        Per-page texts and boxes, like extract_OCR_texts_2, or None if the
+        PDF has no usable text layer (e.g. scanned or rotated pages)
+    """
+    scale = dpi / 72
+    pages: list[PageTexts] = []
+    with fitz.open(pdf_path) as doc:
+        for page in doc:
+            if page.rotation:
+                return None
+            texts: list[str] = []
+            bboxes: list[tuple[int, int, int, int]] = []
+            for x0, y0, x1, y1, word, *_ in page.get_text("words"):
+                if word.strip():
+                    texts.append(word)
+                    bboxes.append(
+                        (
+                            int(x0 * scale),
+                            int(y0 * scale),
+                            round((x1 - x0) * scale),
+                            round((y1 - y0) * scale),
+                        )
+                    )
+            if not texts:
+                return None
+            pages.append((texts, bboxes))
+
+    if sum(len(text) for texts, _ in pages for text in texts) < TEXT_LAYER_MIN_CHARS:
+        return None
+    logger.info("Using embedded text layer of %s", pdf_path.name)
+    return pages
+
+
+def _vlm_model() -> str:
+    """Return the model extract_OCR_texts_2 sends requests to."""
+    if settings.VLM_ENDPOINT:
+        return settings.VLM_ID or settings.OPENAI_MODEL
+    return settings.OPENAI_MODEL
+
+
+async def extract_OCR_texts_cached(
+    image_path: Path,
+) -> tuple[list[str], list[tuple[int, int, int, int]]]:
+    """
+    Extract text and bounding boxes from an image, reusing earlier results.
+
+    Results are cached in MinIO (see storage_service.get_ocr_cache) under
+    the SHA-256 of the page image and the VLM model, so comparing the same
+    documents again skips the VLM calls. Page images are rendered
+    deterministically, so identical inputs give identical keys. Cache
+    failures never fail extraction.
+
+    Args:
+        image_path: Path to the image file
+
+    Returns:
+        Same as extract_OCR_texts_2
+
+    Raises:
+        Exception: If VLM API call fails
+    """
+    if not settings.DOC_OCR_CACHE_ENABLED:
+        return await asyncio.to_thread(extract_OCR_texts_2, image_path)
+
+    def image_digest() -> str:
+        return hashlib.sha256(image_path.read_bytes()).hexdigest()
+
+    digest = await asyncio.to_thread(image_digest)
+    key_source = f"vlm-bbox:{VLM_OCR_VERSION}:{_vlm_model()}:{digest}"
+    key = hashlib.sha256(key_source.encode("utf-8")).hexdigest()
+
+    try:
+        cached = await storage_service.get_ocr_cache(key)
+    except Exception as e:
+        logger.warning(f"OCR cache lookup failed for {image_path.name}: {e}")
+        cached = None
+    if cached is not None:
+        try:
+            texts = [str(text) for text in cached["texts"]]
+            bboxes = [
+                (int(x), int(y), int(w), int(h)) for x, y, w, h in cached["bboxes"]
+            ]
+            if len(texts) == len(bboxes):
+                logger.info(f"OCR cache hit for {image_path.name}")
+                return texts, bboxes
+        except (KeyError, TypeError, ValueError):
+            pass
+
+    texts, bboxes = await asyncio.to_thread(extract_OCR_texts_2, image_path)
+    try:
+        await storage_service.save_ocr_cache(
+            key, {"texts": texts, "bboxes": [list(bbox) for bbox in bboxes]}
+        )
+    except Exception as e:
+        logger.warning(f"Failed to cache OCR output for {image_path.name}: {e}")
+    return texts, bboxes
+
+
 def find_text_differences(
     texts1: list[str],
     texts2: list[str],
@@ -437,18 +724,12 @@ def find_text_differences(
     norm_texts1 = [normalize(t) for t in texts1]
     norm_texts2 = [normalize(t) for t in texts2]
 
-    # Find differences
-    diff_indices1: list[int] = []
-    diff_indices2: list[int] = []
-
-    # Compare texts
-    for i, text1_norm in enumerate(norm_texts1):
-        if text1_norm not in norm_texts2:
-            diff_indices1.append(i)
-
-    for i, text2_norm in enumerate(norm_texts2):
-        if text2_norm not in norm_texts1:
-            diff_indices2.append(i)
+    # Compare texts. Membership is tested against sets, so the comparison
+    # is linear in the number of texts rather than quadratic.
+    norm_set1 = set(norm_texts1)
+    norm_set2 = set(norm_texts2)
+    diff_indices1 = [i for i, t in enumerate(norm_texts1) if t not in norm_set2]
+    diff_indices2 = [i for i, t in enumerate(norm_texts2) if t not in norm_set1]
 
     logger.info(
         f"Found {len(diff_indices1)} differences in first doc, "
@@ -563,7 +844,7 @@ async def compare_document_pair_optimized(
     7. Upload results to storage (parallel)
 
     Optimizations:
-    - Parallel PDF to image conversion where possible
+    - PDF to image conversion overlaps the Excel to PDF conversion
     - Parallel OCR extraction for all pages
     - Parallel bounding box drawing
     - Parallel upload to storage
@@ -617,16 +898,21 @@ async def compare_document_pair_optimized(
             excel_path = renamed_excel_path
             logger.info(f"Renamed Excel file to avoid collision: {excel_path}")
 
-        # Step 2: Convert Excel to PDF (blocking operation, but necessary)
-        excel_pdf_path = await asyncio.to_thread(convert_excel_to_pdf, excel_path)
-
-        # Step 3: Export both PDFs to images concurrently
+        # Steps 2-3: Convert Excel to PDF and export it to images, while the
+        # PDF (which needs no conversion) has its text layer read and is
+        # exported concurrently. If both PDFs have a text layer, words and
+        # boxes are read from it and the VLM OCR is skipped; pages are then
+        # left uncropped so boxes line up.
         logger.info("Exporting PDFs to images in parallel...")
-        excel_images_task = asyncio.to_thread(export_pdf_to_images, excel_pdf_path)
-        pdf_images_task = asyncio.to_thread(export_pdf_to_images, pdf_path)
-        
-        (excel_image_paths, excel_num_pages), (pdf_image_paths, pdf_num_pages) = (
-            await asyncio.gather(excel_images_task, pdf_images_task)
+        pdf_text_layer_task = asyncio.ensure_future(
+            asyncio.to_thread(extract_pdf_text_layer, pdf_path)
+        )
+        (
+            (excel_image_paths, excel_num_pages, excel_text_layer),
+            (pdf_image_paths, pdf_num_pages, pdf_text_layer),
+        ) = await asyncio.gather(
+            _excel_to_images(excel_path, pdf_text_layer_task),
+            _pdf_to_images(pdf_path, pdf_text_layer_task),
         )
 
         # Step 4: Check page count
@@ -641,6 +927,11 @@ async def compare_document_pair_optimized(
         logger.info(f"Processing {excel_num_pages} pages in parallel...")
 
         # Step 5: Process all pages in parallel
+        text_layers = (
+            list(zip(excel_text_layer, pdf_text_layer))
+            if excel_text_layer is not None and pdf_text_layer is not None
+            else None
+        )
         page_tasks = []
         for page_num in range(excel_num_pages):
             task = _process_page_pair(
@@ -649,6 +940,7 @@ async def compare_document_pair_optimized(
                 pdf_image_paths[page_num],
                 page_num,
                 excel_num_pages,
+                text_layers[page_num] if text_layers is not None else None,
             )
             page_tasks.append(task)
 
@@ -692,12 +984,61 @@ async def compare_document_pair_optimized(
         raise
 
 
+async def _excel_to_images(
+    excel_path: Path, pdf_text_layer: asyncio.Future[list[PageTexts] | None]
+) -> tuple[list[Path], int, list[PageTexts] | None]:
+    """
+    Convert an Excel file to PDF and export its pages to images.
+
+    Args:
+        excel_path: Path to the Excel file
+        pdf_text_layer: Text layer of the PDF being compared against. Only
+            if it has one is the converted PDF's text layer read, and its
+            pages kept uncropped
+
+    Returns:
+        Tuple of (list of image file paths, number of pages, text layer or
+        None)
+    """
+    excel_pdf_path = await asyncio.to_thread(convert_excel_to_pdf, excel_path)
+    text_layer = None
+    if await pdf_text_layer is not None:
+        text_layer = await asyncio.to_thread(extract_pdf_text_layer, excel_pdf_path)
+    image_paths, num_pages = await asyncio.to_thread(
+        export_pdf_to_images, excel_pdf_path, crop=text_layer is None
+    )
+    return image_paths, num_pages, text_layer
+
+
+async def _pdf_to_images(
+    pdf_path: Path, pdf_text_layer: asyncio.Future[list[PageTexts] | None]
+) -> tuple[list[Path], int, list[PageTexts] | None]:
+    """
+    Export a PDF's pages to images once its text layer has been read.
+
+    Args:
+        pdf_path: Path to the PDF file
+        pdf_text_layer: The PDF's text layer, still being extracted; pages
+            are kept uncropped if it has one
+
+    Returns:
+        Tuple of (list of image file paths, number of pages, text layer or
+        None)
+    """
+    text_layer = await pdf_text_layer
+    image_paths, num_pages = await asyncio.to_thread(
+        export_pdf_to_images, pdf_path, crop=text_layer is None
+    )
+    return image_paths, num_pages, text_layer
+
+
 async def _process_page_pair(
     task_id: str,
     excel_img_path: Path,
     pdf_img_path: Path,
     page_num: int,
     total_pages: int,
+    text_layers: tuple[PageTexts, PageTexts] | None = None,
 ) -> dict[str, str]:
     """
     Process a single page pair (Excel and PDF) in parallel.
@@ -711,6 +1052,8 @@ async def _process_page_pair(
         pdf_img_path: Path to PDF page image
         page_num: Current page number (0-indexed)
         total_pages: Total number of pages
+        text_layers: Excel and PDF page texts from the documents' text
+            layers; skips OCR when given
 
     Returns:
         Dictionary with EXCEL and PDF result image names
@@ -720,22 +1063,27 @@ async def _process_page_pair(
     """
     try:
         # Step 1: Extract OCR texts and bounding boxes in parallel
-        logger.debug(f"Page {page_num + 1}/{total_pages}: Extracting OCR text...")
-        excel_ocr_task = asyncio.to_thread(extract_OCR_texts_2, excel_img_path)
-        pdf_ocr_task = asyncio.to_thread(extract_OCR_texts_2, pdf_img_path)
-        
-        (excel_texts, excel_bboxes), (pdf_texts, pdf_bboxes) = await asyncio.gather(
-            excel_ocr_task, pdf_ocr_task
-        )
+        if text_layers is not None:
+            (excel_texts, excel_bboxes), (pdf_texts, pdf_bboxes) = text_layers
+        else:
+            logger.debug(
+                "Page %d/%d: Extracting OCR text...", page_num + 1, total_pages
+            )
+            excel_ocr_task = extract_OCR_texts_cached(excel_img_path)
+            pdf_ocr_task = extract_OCR_texts_cached(pdf_img_path)
+
+            (excel_texts, excel_bboxes), (pdf_texts, pdf_bboxes) = (
+                await asyncio.gather(excel_ocr_task, pdf_ocr_task)
+            )
 
         # Step 2: Find differences (CPU-bound but fast)
-        logger.debug(f"Page {page_num + 1}/{total_pages}: Finding differences...")
+        logger.debug("Page %d/%d: Finding differences...", page_num + 1, total_pages)
         excel_diff_indices, pdf_diff_indices = find_text_differences(
             excel_texts, pdf_texts
         )
 
         # Step 3: Draw bounding boxes in parallel
-        logger.debug(f"Page {page_num + 1}/{total_pages}: Drawing bounding boxes...")
+        logger.debug("Page %d/%d: Drawing bounding boxes...", page_num + 1, total_pages)
         excel_bbox_task = asyncio.to_thread(
             draw_bounding_boxes, excel_img_path, excel_bboxes, excel_diff_indices
         )
@@ -748,7 +1096,7 @@ async def _process_page_pair(
         )
 
         # Step 4: Upload to storage in parallel
-        logger.debug(f"Page {page_num + 1}/{total_pages}: Uploading to storage...")
+        logger.debug("Page %d/%d: Uploading to storage...", page_num + 1, total_pages)
         await asyncio.gather(
             save_image_to_storage(task_id, excel_bbox_path),
             save_image_to_storage(task_id, pdf_bbox_path),
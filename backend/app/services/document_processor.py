@@ -6,19 +6,49 @@ Uses pandas/openpyxl for Excel and LLM OCR for PDF.
 """
 
 import asyncio
+import hashlib
+import os
 from io import BytesIO
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeGuard
 
 import fitz  # PyMuPDF
 import pandas as pd
 from PIL import Image
 
+from app.core.config import settings
 from app.core.logging import get_logger
-from app.services.llm_ocr_service import llm_ocr_service
+from app.services.llm_ocr_service import PROMPT_VERSION, llm_ocr_service
+from app.services.storage_service import storage_service
 
 logger = get_logger(__name__)
 
+# File types processed with LLM OCR; only these are worth caching
+OCR_CACHED_TYPES = {"pdf", "image"}
+
+# File types process_file can handle straight from memory
+IN_MEMORY_TYPES = {"excel", "pdf"}
+
+# Keys every cached processing result must have to be reused
+CACHED_RESULT_KEYS = {"file_type", "extracted_data", "text", "fields"}
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# File type for each supported (lowercase) extension
+FILE_TYPES_BY_EXTENSION = {
+    ".xlsx": "excel",
+    ".xls": "excel",
+    ".pdf": "pdf",
+    ".doc": "docx",
+    ".docx": "docx",
+    ".png": "image",
+    ".jpg": "image",
+    ".jpeg": "image",
+    ".bmp": "image",
+    ".tiff": "image",
+    ".gif": "image",
+}
+
 
 class DocumentProcessor:
     """Process documents (Excel/PDF) and extract structured data."""
@@ -30,9 +60,10 @@ class DocumentProcessor:
         file_type: str | None = None,
     ) -> dict[str, Any]:
         """
-        Process a single file and extract structured data.
-        
-        DEPRECATED: Use process_file_from_path instead.
+        Process a single in-memory file and extract structured data.
+
+        Meant for small files (see IN_MEMORY_TYPES for supported types); use
+        process_file_from_path for large files and other types.
 
         Args:
             file_stream: File content as BytesIO
@@ -98,6 +129,182 @@ class DocumentProcessor:
         else:
             raise ValueError(f"Unsupported file type: {file_type}")
 
+    async def process_file_cached(
+        self,
+        source: str | BytesIO,
+        file_name: str | None = None,
+        file_type: str | None = None,
+        inflight: dict[str, asyncio.Task[dict[str, Any]]] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Process a file, reusing OCR output for identical files.
+
+        PDF and image results are cached in MinIO under a key derived from
+        the file's SHA-256, the OCR model and the prompt version, so the same
+        document uploaded again skips the LLM entirely. Cache failures never
+        fail processing; they just fall through to a normal run.
+
+        Callers processing a batch can pass a shared ``inflight`` dict so
+        identical files within the batch run OCR once, even when they are
+        processed concurrently and nothing is cached yet.
+
+        Args:
+            source: Path to local file, or in-memory content (see process_file)
+            file_name: Original file name (required for in-memory content;
+                use Path basename if None)
+            file_type: File type (auto-detect if None)
+            inflight: Batch-local processing tasks keyed by OCR cache key
+
+        Returns:
+            Same result dictionary as process_file_from_path
+        """
+        if file_name is None:
+            if isinstance(source, BytesIO):
+                raise ValueError("file_name is required for in-memory content")
+            file_name = Path(source).name
+        if file_type is None:
+            file_type = self.detect_file_type(file_name)
+
+        if file_type not in OCR_CACHED_TYPES or (
+            not settings.DOC_OCR_CACHE_ENABLED and inflight is None
+        ):
+            return await self._process_source(source, file_name, file_type)
+
+        key = await self._ocr_cache_key(source, file_type)
+        if inflight is None:
+            return await self._process_with_ocr_cache(
+                key, source, file_name, file_type
+            )
+
+        task = inflight.get(key)
+        if task is not None:
+            # Shielded so cancelling a duplicate doesn't cancel the original
+            logger.info(f"Reusing OCR output of an identical file for {file_name}")
+            result = await asyncio.shield(task)
+            return {**result, "file_name": file_name}
+
+        task = asyncio.ensure_future(
+            self._process_with_ocr_cache(key, source, file_name, file_type)
+        )
+        inflight[key] = task
+        return await task
+
+    async def _process_with_ocr_cache(
+        self,
+        key: str,
+        source: str | BytesIO,
+        file_name: str,
+        file_type: str,
+    ) -> dict[str, Any]:
+        """
+        Process a file through the MinIO OCR cache.
+
+        Args:
+            key: OCR cache key (see _ocr_cache_key)
+            source: Path to local file, or in-memory content
+            file_name: Original file name
+            file_type: File type
+
+        Returns:
+            Processing result dictionary
+        """
+        if not settings.DOC_OCR_CACHE_ENABLED:
+            return await self._process_source(source, file_name, file_type)
+
+        try:
+            cached = await storage_service.get_ocr_cache(key)
+        except Exception as e:
+            logger.warning(f"OCR cache lookup failed for {file_name}: {e}")
+            cached = None
+
+        if self._is_reusable_result(cached, file_type):
+            logger.info(f"OCR cache hit for {file_name}")
+            return {**cached, "file_name": file_name}
+
+        result = await self._process_source(source, file_name, file_type)
+        if self._is_reusable_result(result, file_type):
+            try:
+                await storage_service.save_ocr_cache(key, result)
+            except Exception as e:
+                logger.warning(f"Failed to cache OCR output for {file_name}: {e}")
+        return result
+
+    async def _process_source(
+        self,
+        source: str | BytesIO,
+        file_name: str,
+        file_type: str,
+    ) -> dict[str, Any]:
+        """
+        Dispatch to the in-memory or path-based processing entry point.
+
+        Args:
+            source: Path to local file, or in-memory content
+            file_name: Original file name
+            file_type: File type
+
+        Returns:
+            Processing result dictionary
+        """
+        if isinstance(source, BytesIO):
+            return await self.process_file(source, file_name, file_type)
+        return await self.process_file_from_path(source, file_name, file_type)
+
+    async def _ocr_cache_key(self, source: str | BytesIO, file_type: str) -> str:
+        """
+        Build the OCR cache key for a file.
+
+        Args:
+            source: Path to local file, or in-memory content
+            file_type: Detected file type
+
+        Returns:
+            Hex digest identifying the file content and OCR configuration
+        """
+
+        def file_digest() -> str:
+            if isinstance(source, BytesIO):
+                return hashlib.sha256(source.getbuffer()).hexdigest()
+            hasher = hashlib.sha256()
+            with open(source, "rb") as f:
+                while chunk := f.read(HASH_CHUNK_SIZE):
+                    hasher.update(chunk)
+            return hasher.hexdigest()
+
+        digest = await asyncio.to_thread(file_digest)
+        key_source = f"{llm_ocr_service.model}:{PROMPT_VERSION}:{file_type}:{digest}"
+        return hashlib.sha256(key_source.encode("utf-8")).hexdigest()
+
+    def _is_reusable_result(
+        self, result: Any, file_type: str
+    ) -> TypeGuard[dict[str, Any]]:
+        """
+        Check whether a processing result can be served from the OCR cache.
+
+        Rejects malformed entries and results where any page failed OCR, so
+        transient LLM errors are never cached.
+
+        Args:
+            result: Processing result (or cached payload) to check
+            file_type: Expected file type
+
+        Returns:
+            True if the result is complete and error-free
+        """
+        if not isinstance(result, dict) or not CACHED_RESULT_KEYS <= result.keys():
+            return False
+        if result["file_type"] != file_type:
+            return False
+
+        pages = result["extracted_data"]
+        if isinstance(pages, dict):
+            pages = [pages]
+        if not isinstance(pages, list):
+            return False
+        return not any(
+            not isinstance(page, dict) or "error" in page for page in pages
+        )
+
     def detect_file_type(self, file_name: str) -> str:
         """
         Detect file type from extension.
@@ -111,17 +318,11 @@ class DocumentProcessor:
         Raises:
             ValueError: If file type cannot be detected
         """
-        ext = Path(file_name).suffix.lower()
-        if ext in [".xlsx", ".xls"]:
-            return "excel"
-        elif ext == ".pdf":
-            return "pdf"
-        elif ext in [".doc", ".docx"]:
-            return "docx"
-        elif ext in [".png", ".jpg", ".jpeg", ".bmp", ".tiff", ".gif"]:
-            return "image"
-        else:
-            raise ValueError(f"Cannot detect file type for: {file_name}")
+        ext = os.path.splitext(file_name)[1].lower()
+        try:
+            return FILE_TYPES_BY_EXTENSION[ext]
+        except KeyError:
+            raise ValueError(f"Cannot detect file type for: {file_name}") from None
 
     async def _process_excel(
         self,
@@ -130,8 +331,6 @@ class DocumentProcessor:
     ) -> dict[str, Any]:
         """
         Process Excel file and extract structured data.
-        
-        DEPRECATED: Use _process_excel_from_path instead.
 
         Args:
             file_stream: Excel file content as BytesIO
@@ -217,8 +416,6 @@ class DocumentProcessor:
     ) -> dict[str, Any]:
         """
         Process PDF file using LLM OCR.
-        
-        DEPRECATED: Use _process_pdf_from_path instead.
 
         Args:
             file_stream: PDF file content as BytesIO
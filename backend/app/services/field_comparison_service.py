@@ -4,16 +4,30 @@ Field comparison service.
 Compares extracted fields from multiple documents and identifies differences.
 """
 
+import copy
+import hashlib
+import json
 from typing import Any
 
+from app.core.cache import TTLCache
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Comparison results for recently seen document sets (retries and UI
+# re-submissions compare the same fields again)
+COMPARISON_CACHE_MAXSIZE = 256
+COMPARISON_CACHE_TTL = 600.0
+
 
 class FieldComparisonService:
     """Compare extracted fields from multiple documents."""
 
+    def __init__(self) -> None:
+        self._cache: TTLCache[bytes, dict[str, Any]] = TTLCache(
+            maxsize=COMPARISON_CACHE_MAXSIZE, ttl=COMPARISON_CACHE_TTL
+        )
+
     def compare_documents(
         self,
         document_results: list[dict[str, Any]],
@@ -21,6 +35,10 @@ class FieldComparisonService:
         """
         Compare multiple documents and identify field differences.
 
+        Results are memoized on the documents' names and fields, the only
+        inputs the comparison reads. Each caller gets its own copy, so
+        mutating the result never touches the cached entry.
+
         Args:
             document_results: List of document extraction results
 
@@ -30,6 +48,42 @@ class FieldComparisonService:
             - differences: List of differences
             - matches: List of matching fields
         """
+        key = self._comparison_key(document_results)
+        result = self._cache.get(key)
+        if result is None:
+            result = self._compare_documents(document_results)
+            self._cache.set(key, result)
+        return copy.deepcopy(result)
+
+    def _comparison_key(self, document_results: list[dict[str, Any]]) -> bytes:
+        """
+        Build a stable digest of the comparison inputs.
+
+        Args:
+            document_results: List of document extraction results
+
+        Returns:
+            16-byte digest of each document's name and fields, in order
+        """
+        inputs = [
+            [doc["file_name"], doc.get("fields", {})] for doc in document_results
+        ]
+        payload = json.dumps(inputs, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.blake2b(payload, digest_size=16).digest()
+
+    def _compare_documents(
+        self,
+        document_results: list[dict[str, Any]],
+    ) -> dict[str, Any]:
+        """
+        Compare multiple documents without consulting the cache.
+
+        Args:
+            document_results: List of document extraction results
+
+        Returns:
+            Comparison results (see compare_documents)
+        """
         if len(document_results) < 2:
             return {
                 "error": "Need at least 2 documents to compare",
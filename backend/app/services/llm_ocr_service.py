@@ -29,6 +29,45 @@ MAX_RETRIES = 3
 INITIAL_DELAY = 1.0
 MAX_DELAY = 10.0
 
+# Version of the extraction prompts. Part of the OCR cache key, so bump it
+# whenever the prompts change to stop reusing output from the old ones.
+PROMPT_VERSION = "2"
+
+# Prompts are module constants so every request sends byte-identical
+# prefixes, which the provider's automatic prompt caching relies on
+SYSTEM_PROMPT = (
+    "You are an expert at extracting text and structured data "
+    "from document images. Always return valid JSON."
+)
+
+FIELD_EXTRACTION_PROMPT = """
+Analyze this document image and extract:
+1. All text content (preserve structure)
+2. Structured fields:
+   - Amounts (numbers with currency)
+   - Dates
+   - Names/Companies
+   - Line items (if table format)
+   - Reference numbers
+   - Any other important fields
+
+Return as JSON with structure:
+{
+    "text": "full text content",
+    "fields": {
+        "amounts": [...],
+        "dates": [...],
+        "line_items": [...],
+        ...
+    }
+}
+"""
+
+TEXT_EXTRACTION_PROMPT = (
+    "Extract all text from this image. "
+    "Preserve the structure and formatting."
+)
+
 
 class LLMOCRService:
     """LLM-based OCR using GPT-4 Vision with retry and timeout handling."""
@@ -88,54 +127,23 @@ class LLMOCRService:
             )
 
         try:
-            # Encode image
-            base64_image = self._encode_image(image)
+            # Encode image. PNG compression of a full page takes long enough
+            # to stall the event loop, and PIL releases the GIL while
+            # compressing, so pages of one document encode in parallel
+            base64_image = await asyncio.to_thread(self._encode_image, image)
 
-            # Prepare prompt
-            if extract_fields:
-                prompt = """
-                Analyze this document image and extract:
-                1. All text content (preserve structure)
-                2. Structured fields:
-                   - Amounts (numbers with currency)
-                   - Dates
-                   - Names/Companies
-                   - Line items (if table format)
-                   - Reference numbers
-                   - Any other important fields
-
-                Return as JSON with structure:
-                {
-                    "text": "full text content",
-                    "fields": {
-                        "amounts": [...],
-                        "dates": [...],
-                        "line_items": [...],
-                        ...
-                    }
-                }
-                """
-            else:
-                prompt = (
-                    "Extract all text from this image. "
-                    "Preserve the structure and formatting."
-                )
+            prompt = FIELD_EXTRACTION_PROMPT if extract_fields else TEXT_EXTRACTION_PROMPT
 
-            # Call GPT-4 Vision
+            # Call GPT-4 Vision. The system prompt and image come first so the
+            # text-only and field-extraction passes over the same image share
+            # a cacheable prefix; only the trailing instruction differs.
             response = await self.client.chat.completions.create(
                 model=self.model,
                 messages=[
-                    {
-                        "role": "system",
-                        "content": (
-                            "You are an expert at extracting text and structured data "
-                            "from document images. Always return valid JSON."
-                        ),
-                    },
+                    {"role": "system", "content": SYSTEM_PROMPT},
                     {
                         "role": "user",
                         "content": [
-                            {"type": "text", "text": prompt},
                             {
                                 "type": "image_url",
                                 "image_url": {
@@ -143,11 +151,14 @@ class LLMOCRService:
                                     "detail": "high",  # High detail for better OCR
                                 },
                             },
+                            {"type": "text", "text": prompt},
                         ],
                     },
                 ],
                 response_format={"type": "json_object"},
                 temperature=0.1,  # Low temperature for consistent extraction
+                # Route requests sharing this prefix to the same prompt cache
+                prompt_cache_key=f"ocr-v{PROMPT_VERSION}",
             )
 
             # Parse response
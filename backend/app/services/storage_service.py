@@ -9,24 +9,57 @@ All routes should use this service instead of directly accessing MinIO.
 """
 
 import asyncio
+import functools
 import json
 import os
-import tempfile
+import shutil
+import tarfile
 import time
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
-from pathlib import Path
-from typing import Any
+from typing import Any, TypedDict, TypeVar
 from uuid import UUID
 
+import certifi
+import urllib3
 from fastapi import UploadFile
 from minio import Minio
 from minio.error import S3Error
 
+from app.core.cache import TTLCache
 from app.core.config import settings
 from app.core.logging import get_logger
+from app.core.temp_pool import temp_file_pool
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
+# Name of the per-task OCR results object written by save_ocr_result
+OCR_RESULTS_FILENAME = "ocr_results.json"
+
+# Processable-file listings per task. Only meant to coalesce duplicate
+# submissions fired within a few seconds; writes through this service
+# invalidate the task's entry.
+LISTING_CACHE_MAXSIZE = 1024
+LISTING_CACHE_TTL = 5.0
+
+# Connect/read timeout in seconds for MinIO requests (minio-py's default)
+MINIO_HTTP_TIMEOUT = 300
+
+# Buffer size for streaming object downloads to local files
+DOWNLOAD_BUFFER_SIZE = 1024 * 1024
+
+
+class UploadedFileMetadata(TypedDict):
+    """Metadata of a file stored by upload_file_from_upload."""
+
+    file_name: str
+    file_path: str
+    file_size: int
+    content_type: str
+
 
 class StorageService:
     """
@@ -42,9 +75,127 @@ class StorageService:
             access_key=settings.MINIO_ACCESS_KEY,
             secret_key=settings.MINIO_SECRET_KEY,
             secure=settings.MINIO_SECURE,
+            http_client=self._create_http_client(),
         )
         self.bucket = settings.MINIO_BUCKET
         self.output_bucket = settings.MINIO_OUTPUT_BUCKET
+        # minio-py is synchronous; its calls run in a dedicated pool so slow
+        # storage I/O can't starve the default executor used for CPU work
+        self._executor = self._create_executor()
+        self._listing_cache: TTLCache[str, list[dict[str, Any]]] = TTLCache(
+            maxsize=LISTING_CACHE_MAXSIZE, ttl=LISTING_CACHE_TTL
+        )
+
+    def close(self) -> None:
+        """
+        Shut down the storage thread pool, waiting for in-flight calls.
+
+        A fresh pool takes its place (threads are only started on demand),
+        so the service stays usable if the app is started again in the same
+        process, e.g. by test clients.
+        """
+        executor, self._executor = self._executor, self._create_executor()
+        executor.shutdown(wait=True)
+
+    @staticmethod
+    def _create_executor() -> ThreadPoolExecutor:
+        """
+        Create the thread pool for blocking MinIO calls.
+
+        Returns:
+            Executor with MINIO_MAX_WORKERS threads
+        """
+        return ThreadPoolExecutor(
+            max_workers=settings.MINIO_MAX_WORKERS,
+            thread_name_prefix="minio",
+        )
+
+    @staticmethod
+    def _create_http_client() -> urllib3.PoolManager:
+        """
+        Create the MinIO HTTP client.
+
+        Mirrors minio-py's default client, except that the connection pool
+        holds one connection per storage worker thread. With the default
+        (10) any extra workers would open and discard a connection per call.
+
+        Returns:
+            urllib3 pool manager for the MinIO client
+        """
+        timeout = MINIO_HTTP_TIMEOUT
+        return urllib3.PoolManager(
+            timeout=urllib3.Timeout(connect=timeout, read=timeout),
+            maxsize=settings.MINIO_MAX_WORKERS,
+            cert_reqs="CERT_REQUIRED",
+            ca_certs=os.environ.get("SSL_CERT_FILE") or certifi.where(),
+            retries=urllib3.Retry(
+                total=5,
+                backoff_factor=0.2,
+                status_forcelist=[500, 502, 503, 504],
+            ),
+        )
+
+    async def _run(self, func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+        """
+        Run a blocking MinIO call in the storage thread pool.
+
+        Args:
+            func: Blocking callable
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            The callable's return value
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
+
+    def _read_object(self, object_name: str) -> bytes:
+        """
+        Read a whole object from the default bucket (blocking).
+
+        Args:
+            object_name: Object name in MinIO
+
+        Returns:
+            Object content
+        """
+        response = self.client.get_object(self.bucket, object_name)
+        try:
+            return response.read()
+        finally:
+            response.close()
+            response.release_conn()
+
+    def _download_to_path(self, object_name: str, file_path: str) -> None:
+        """
+        Stream an object into an existing local file (blocking).
+
+        Unlike fget_object this writes in place, keeping the file's inode,
+        and skips the extra stat request.
+
+        Args:
+            object_name: Object name in MinIO
+            file_path: Local destination path (overwritten)
+        """
+        response = self.client.get_object(self.bucket, object_name)
+        try:
+            with open(file_path, "wb") as f:
+                shutil.copyfileobj(response, f, DOWNLOAD_BUFFER_SIZE)
+        finally:
+            response.close()
+            response.release_conn()
+
+    def _invalidate_listing(self, object_name: str) -> None:
+        """
+        Drop the cached listing of the task folder containing an object.
+
+        Args:
+            object_name: Object name (or task folder) in the default bucket
+        """
+        self._listing_cache.pop(object_name.split("/", 1)[0])
 
     async def ensure_bucket_exists(self, bucket_name: str | None = None) -> None:
         """
@@ -60,11 +211,11 @@ class StorageService:
         """
         bucket = bucket_name or self.bucket
         try:
-            bucket_exists = await asyncio.to_thread(
+            bucket_exists = await self._run(
                 self.client.bucket_exists, bucket
             )
             if not bucket_exists:
-                await asyncio.to_thread(
+                await self._run(
                     self.client.make_bucket, bucket
                 )
                 logger.info(f"Created bucket: {bucket}")
@@ -74,7 +225,7 @@ class StorageService:
 
     async def upload_file_from_upload(
         self, task_id: UUID | str, file: UploadFile
-    ) -> dict[str, str | int]:
+    ) -> UploadedFileMetadata:
         """
         Upload a file from FastAPI UploadFile to MinIO storage.
 
@@ -83,7 +234,7 @@ class StorageService:
             file: FastAPI UploadFile to upload
 
         Returns:
-            Dictionary with file metadata:
+            File metadata:
                 - file_name: Original filename
                 - file_path: Full path in MinIO (object_name)
                 - file_size: Size in bytes
@@ -107,38 +258,55 @@ class StorageService:
         else:
             object_name = f"{task_id}/{unique_filename}"
 
-        # Read file content
-        content = await file.read()
-        file_size = len(content)
-        # Reset file pointer in case the UploadFile is reused elsewhere
+        # Stream the spooled upload straight into MinIO instead of reading it
+        # into memory and copying it through another temp file
+        file_size = file.size
+        if file_size is None:
+            file_size = await asyncio.to_thread(file.file.seek, 0, os.SEEK_END)
         await file.seek(0)
+        content_type = file.content_type or "application/octet-stream"
 
-        # Save to temp file
-        temp_fd, temp_path = tempfile.mkstemp(suffix=Path(filename).suffix)
         try:
-            with os.fdopen(temp_fd, "wb") as f:
-                f.write(content)
-
-            # Upload to MinIO
-            await self.upload_file(
-                temp_path,
+            await self._run(
+                self.client.put_object,
+                self.bucket,
                 object_name,
-                content_type=file.content_type,
+                file.file,
+                length=file_size,
+                content_type=content_type,
             )
+            logger.info(f"Uploaded {filename} to {object_name} in bucket {self.bucket}")
+            self._invalidate_listing(object_name)
+        except S3Error as e:
+            logger.error(f"Error uploading file: {e}")
+            raise
+        finally:
+            # Reset file pointer in case the UploadFile is reused elsewhere
+            await file.seek(0)
 
-            return {
-                "file_name": filename,
-                "file_path": object_name,
-                "file_size": file_size,
-                "content_type": file.content_type or "application/octet-stream",
-            }
+        return {
+            "file_name": filename,
+            "file_path": object_name,
+            "file_size": file_size,
+            "content_type": content_type,
+        }
 
-        finally:
-            # Clean up temp file
-            try:
-                os.unlink(temp_path)
-            except Exception as e:
-                logger.warning(f"Failed to delete temp file {temp_path}: {e}")
+    def _list_objects(self, prefix: str) -> list[Any]:
+        """
+        List all objects under a prefix (blocking).
+
+        Creating the listing generator and draining it both happen here, so
+        the whole listing runs in a single storage thread call.
+
+        Args:
+            prefix: Object name prefix
+
+        Returns:
+            List of minio Object entries
+        """
+        return list(
+            self.client.list_objects(self.bucket, prefix=prefix, recursive=True)
+        )
 
     async def delete_folder(self, task_id: UUID | str) -> None:
         """
@@ -153,16 +321,11 @@ class StorageService:
         prefix = f"{task_id}/"
         try:
             # List all objects with the prefix
-            objects = await asyncio.to_thread(
-                list,
-                self.client.list_objects(
-                    self.bucket, prefix=prefix, recursive=True
-                ),
-            )
+            objects = await self._run(self._list_objects, prefix)
 
             # Delete each object
             for obj in objects:
-                await asyncio.to_thread(
+                await self._run(
                     self.client.remove_object,
                     self.bucket,
                     obj.object_name,
@@ -173,13 +336,18 @@ class StorageService:
         except S3Error as e:
             logger.error(f"Error deleting folder {prefix}: {e}")
             raise
+        finally:
+            self._invalidate_listing(str(task_id))
 
-    async def list_files(self, task_id: str) -> list[dict[str, Any]]:
+    async def list_files(
+        self, task_id: str, suffix_exclude: str | None = None
+    ) -> list[dict[str, Any]]:
         """
         List all files for a task_id.
 
         Args:
             task_id: Unique identifier for the task
+            suffix_exclude: Skip objects whose name ends with this suffix
 
         Returns:
             List of file metadata dictionaries
@@ -189,66 +357,179 @@ class StorageService:
         """
         prefix = f"{task_id}/"
         try:
-            objects = await asyncio.to_thread(
-                list,
-                self.client.list_objects(self.bucket, prefix=prefix, recursive=True),
-            )
+            objects = await self._run(self._list_objects, prefix)
             return [
                 {
                     "name": obj.object_name,
                     "size": obj.size,
+                    "etag": obj.etag,
                     "last_modified": obj.last_modified,
                 }
                 for obj in objects
+                if not (suffix_exclude and obj.object_name.endswith(suffix_exclude))
             ]
         except S3Error as e:
             logger.error(f"Error listing files: {e}")
             raise
 
-    async def download_file_to_temp(self, object_name: str) -> str:
+    async def list_processable_files(self, task_id: str) -> list[dict[str, Any]]:
+        """
+        List a task's input files, excluding the OCR results object.
+
+        The listing is cached for a few seconds so duplicate submissions of
+        the same task share one MinIO listing.
+
+        Args:
+            task_id: Unique identifier for the task
+
+        Returns:
+            List of file metadata dictionaries (see list_files)
+
+        Raises:
+            S3Error: If MinIO operation fails
+        """
+        files = self._listing_cache.get(task_id)
+        if files is None:
+            files = await self.list_files(task_id, suffix_exclude=OCR_RESULTS_FILENAME)
+            self._listing_cache.set(task_id, files)
+        return list(files)
+
+    async def download_file_to_temp(
+        self, object_name: str, size: int | None = None
+    ) -> str:
         """
         Download file from MinIO to temp directory.
 
+        Objects of at least MINIO_RANGED_DOWNLOAD_THRESHOLD bytes are fetched
+        with concurrent ranged GETs (see download_file_parallel) when their
+        size is known.
+
         Args:
             object_name: Object name in MinIO
+            size: Object size in bytes, if already known (e.g. from a listing)
 
         Returns:
-            Path to the downloaded temp file
+            Path to the downloaded temp file. Release it with
+            temp_file_pool.release once done.
 
         Raises:
             S3Error: If MinIO operation fails
         """
         temp_path = None
         try:
-            # Create temp file with proper extension
-            file_ext = Path(object_name).suffix
-            temp_fd, temp_path = tempfile.mkstemp(suffix=file_ext)
-            os.close(temp_fd)
-
-            # Download file to temp path
-            await asyncio.to_thread(
-                self.client.fget_object,
-                self.bucket,
-                object_name,
-                temp_path,
-            )
+            # Reuse a pooled temp file with the proper extension
+            temp_path = temp_file_pool.acquire(os.path.splitext(object_name)[1])
+
+            if size is not None and size >= settings.MINIO_RANGED_DOWNLOAD_THRESHOLD:
+                await self.download_file_parallel(object_name, temp_path, size)
+            else:
+                # Download file to temp path
+                await self._run(self._download_to_path, object_name, temp_path)
             logger.info(f"Downloaded {object_name} to {temp_path}")
             return temp_path
-        except S3Error as e:
+        except Exception as e:
             logger.error(f"Error downloading file {object_name}: {e}")
-            # Clean up temp file on error
+            # Return temp file to the pool on error
             if temp_path is not None:
-                try:
-                    os.unlink(temp_path)
-                except Exception:
-                    pass
+                temp_file_pool.release(temp_path)
+            raise
+
+    async def download_file_parallel(
+        self,
+        object_name: str,
+        file_path: str,
+        size: int,
+        chunk_size: int | None = None,
+        max_concurrency: int | None = None,
+    ) -> None:
+        """
+        Download an object as concurrent ranged GETs written into place.
+
+        A single GET is bound by one TCP stream; splitting large objects into
+        byte ranges fetched in parallel uses the available bandwidth. Each
+        range is streamed to its offset in DOWNLOAD_BUFFER_SIZE pieces, so
+        memory stays bounded by ``max_concurrency`` buffers regardless of
+        the chunk size.
+
+        Args:
+            object_name: Object name in MinIO
+            file_path: Local destination path (created or overwritten)
+            size: Object size in bytes
+            chunk_size: Bytes per ranged GET (default from settings)
+            max_concurrency: Max ranged GETs in flight (default from settings)
+
+        Raises:
+            S3Error: If MinIO operation fails
+        """
+        chunk_size = chunk_size or settings.MINIO_RANGED_DOWNLOAD_CHUNK_SIZE
+        max_concurrency = max_concurrency or settings.MINIO_RANGED_DOWNLOAD_CONCURRENCY
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        def fetch_range(fd: int, offset: int, length: int) -> None:
+            response = self.client.get_object(
+                self.bucket, object_name, offset=offset, length=length
+            )
+            try:
+                for data in response.stream(DOWNLOAD_BUFFER_SIZE):
+                    os.pwrite(fd, data, offset)
+                    offset += len(data)
+            finally:
+                response.close()
+                response.release_conn()
+
+        async def fetch(fd: int, offset: int) -> None:
+            async with semaphore:
+                length = min(chunk_size, size - offset)
+                await self._run(fetch_range, fd, offset, length)
+
+        fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            os.ftruncate(fd, size)
+            await asyncio.gather(
+                *(fetch(fd, offset) for offset in range(0, size, chunk_size))
+            )
+        finally:
+            os.close(fd)
+
+    async def extract_tar_object(self, object_name: str, dest_dir: str) -> None:
+        """
+        Stream a tar archive from MinIO and extract it into a directory.
+
+        The archive is read in a single pass straight from the response
+        (any compression tarfile detects), without a local copy. Members
+        are extracted with the "data" filter, which rejects absolute paths,
+        links outside ``dest_dir`` and special files.
+
+        Args:
+            object_name: Object name of the archive in MinIO
+            dest_dir: Local directory to extract into
+
+        Raises:
+            S3Error: If MinIO operation fails
+            tarfile.TarError: If the archive is invalid or unsafe
+        """
+
+        def extract() -> None:
+            response = self.client.get_object(self.bucket, object_name)
+            try:
+                with tarfile.open(fileobj=response, mode="r|*") as archive:
+                    archive.extractall(dest_dir, filter="data")
+            finally:
+                response.close()
+                response.release_conn()
+
+        try:
+            await self._run(extract)
+        except Exception as e:
+            logger.error(f"Error extracting archive {object_name}: {e}")
             raise
 
     async def get_file_stream(self, object_name: str) -> BytesIO:
         """
         Get file as stream (in-memory, no disk I/O).
 
-        DEPRECATED: Use download_file_to_temp instead.
+        Only for small objects: the whole object is held in memory. Use
+        download_file_to_temp for anything that may be large.
 
         Args:
             object_name: Object name in MinIO
@@ -260,21 +541,55 @@ class StorageService:
             S3Error: If MinIO operation fails
         """
         try:
-            response = await asyncio.to_thread(
-                self.client.get_object,
-                self.bucket,
-                object_name,
-            )
-            # Read entire file into memory (for small-medium files)
-            # For large files, consider chunked processing
-            data = response.read()
-            response.close()
-            response.release_conn()
+            data = await self._run(self._read_object, object_name)
             return BytesIO(data)
         except S3Error as e:
             logger.error(f"Error getting file {object_name}: {e}")
             raise
 
+    async def open_object_stream(self, object_name: str) -> AsyncIterator[bytes]:
+        """
+        Open an object for streaming, e.g. into a StreamingResponse.
+
+        The GET is issued before returning, so a missing object raises here
+        rather than after a response has started. Chunks are read in the
+        storage thread pool and the connection is released once the
+        iterator is exhausted or closed.
+
+        Args:
+            object_name: Object name in MinIO
+
+        Returns:
+            Async iterator over the object's bytes
+
+        Raises:
+            S3Error: If MinIO operation fails
+        """
+        try:
+            response = await self._run(self.client.get_object, self.bucket, object_name)
+        except S3Error as e:
+            logger.error(f"Error getting file {object_name}: {e}")
+            raise
+        return self._iter_response(response)
+
+    async def _iter_response(self, response: Any) -> AsyncIterator[bytes]:
+        """
+        Yield a MinIO response body in DOWNLOAD_BUFFER_SIZE chunks.
+
+        Args:
+            response: urllib3 response from get_object
+
+        Yields:
+            Chunks of the response body
+        """
+        try:
+            chunks = response.stream(DOWNLOAD_BUFFER_SIZE)
+            while chunk := await self._run(next, chunks, None):
+                yield chunk
+        finally:
+            response.close()
+            response.release_conn()
+
     async def upload_file(
         self,
         file_path: str,
@@ -303,7 +618,7 @@ class StorageService:
         await self.ensure_bucket_exists(target_bucket)
         
         try:
-            await asyncio.to_thread(
+            await self._run(
                 self.client.fput_object,
                 target_bucket,
                 object_name,
@@ -311,6 +626,8 @@ class StorageService:
                 content_type=content_type,
             )
             logger.info(f"Uploaded {file_path} to {object_name} in bucket {target_bucket}")
+            if target_bucket == self.bucket:
+                self._invalidate_listing(object_name)
             return object_name
         except S3Error as e:
             logger.error(f"Error uploading file: {e}")
@@ -327,12 +644,13 @@ class StorageService:
             S3Error: If MinIO operation fails
         """
         try:
-            await asyncio.to_thread(
+            await self._run(
                 self.client.remove_object,
                 self.bucket,
                 object_name,
             )
             logger.info(f"Deleted {object_name}")
+            self._invalidate_listing(object_name)
         except S3Error as e:
             logger.error(f"Error deleting file {object_name}: {e}")
             raise
@@ -351,11 +669,15 @@ class StorageService:
         Raises:
             S3Error: If MinIO operation fails
         """
-        object_name = f"{task_id}/ocr_results.json"
-        data = json.dumps(result_data, indent=2).encode("utf-8")
+        object_name = f"{task_id}/{OCR_RESULTS_FILENAME}"
+        # Compact, UTF-8 output: OCR text is mostly non-ASCII, and \uXXXX
+        # escapes plus indentation roughly double the payload
+        data = json.dumps(
+            result_data, ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
 
         try:
-            await asyncio.to_thread(
+            await self._run(
                 self.client.put_object,
                 self.bucket,
                 object_name,
@@ -382,23 +704,79 @@ class StorageService:
         Raises:
             S3Error: If MinIO operation fails (except NoSuchKey)
         """
-        object_name = f"{task_id}/ocr_results.json"
+        object_name = f"{task_id}/{OCR_RESULTS_FILENAME}"
         try:
-            response = await asyncio.to_thread(
-                self.client.get_object,
-                self.bucket,
-                object_name,
+            result: dict[str, Any] = json.loads(
+                await self._run(self._read_object, object_name)
             )
-            data = json.loads(response.read())
-            response.close()
-            response.release_conn()
-            return data
+            return result
         except S3Error as e:
             if e.code == "NoSuchKey":
                 return None
             logger.error(f"Error getting OCR results: {e}")
             raise
 
+    async def get_ocr_cache(self, key: str) -> dict[str, Any] | None:
+        """
+        Retrieve cached OCR output for a file.
+
+        Args:
+            key: Content-addressed cache key
+
+        Returns:
+            Cached processing result or None if not cached (or the entry is
+            not a JSON object)
+
+        Raises:
+            S3Error: If MinIO operation fails (except NoSuchKey)
+        """
+        object_name = f"ocr_cache/{key}.json"
+        try:
+            result = json.loads(await self._run(self._read_object, object_name))
+        except S3Error as e:
+            if e.code == "NoSuchKey":
+                return None
+            logger.error(f"Error getting OCR cache entry {key}: {e}")
+            raise
+        if not isinstance(result, dict):
+            logger.warning(f"Ignoring malformed OCR cache entry {key}")
+            return None
+        return result
+
+    async def save_ocr_cache(self, key: str, result_data: dict[str, Any]) -> str:
+        """
+        Store OCR output for a file under its content-addressed key.
+
+        Args:
+            key: Content-addressed cache key
+            result_data: Processing result to cache
+
+        Returns:
+            Object name where the entry was saved
+
+        Raises:
+            S3Error: If MinIO operation fails
+        """
+        object_name = f"ocr_cache/{key}.json"
+        data = json.dumps(
+            result_data, ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+
+        try:
+            await self._run(
+                self.client.put_object,
+                self.bucket,
+                object_name,
+                BytesIO(data),
+                length=len(data),
+                content_type="application/json",
+            )
+            logger.info(f"Saved OCR cache entry {object_name}")
+            return object_name
+        except S3Error as e:
+            logger.error(f"Error saving OCR cache entry: {e}")
+            raise
+
 
 # Singleton instance
 storage_service = StorageService()
@@ -1,8 +1,38 @@
 """Tests for file management endpoints."""
 
+from collections.abc import Generator
+from datetime import datetime, timezone
 from io import BytesIO
 
+import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.core.database import get_session
+from app.core.security import create_access_token
+from app.main import app
+from app.models.file import File
+from app.models.user import User
+
+
+@pytest.fixture
+def session() -> Generator[Session, None, None]:
+    """In-memory database session shared with the app for one test."""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine, tables=[User.__table__, File.__table__])
+    with Session(engine) as session:
+
+        def get_test_session() -> Generator[Session, None, None]:
+            yield session
+
+        app.dependency_overrides[get_session] = get_test_session
+        yield session
+        app.dependency_overrides.pop(get_session, None)
 
 
 def test_upload_file_success(client: TestClient) -> None:
@@ -45,6 +75,38 @@ def test_upload_file_no_filename(client: TestClient) -> None:
     assert response.status_code == 400
 
 
+def test_upload_file_too_large() -> None:
+    """Test that validate_file rejects files larger than the maximum size."""
+    from fastapi import HTTPException, UploadFile
+
+    from app.api.routes.files import MAX_FILE_SIZE, validate_file
+
+    file = UploadFile(BytesIO(b""), filename="test.pdf", size=MAX_FILE_SIZE + 1)
+
+    with pytest.raises(HTTPException) as exc_info:
+        validate_file(file)
+
+    assert exc_info.value.status_code == 413
+
+
+def test_upload_body_too_large_rejected_before_handler(client: TestClient) -> None:
+    """Test that an upload over the file size limit is rejected from its headers."""
+    from unittest.mock import patch
+    from uuid import uuid4
+
+    file_content = b"x" * (51 * 1024 * 1024)
+    files = {"file": ("test.pdf", BytesIO(file_content), "application/pdf")}
+
+    fake_task_id = str(uuid4())
+    with patch("app.api.routes.files.validate_file") as mock_validate:
+        response = client.post(
+            f"/api/v1/files/upload?task_id={fake_task_id}", files=files
+        )
+
+    assert response.status_code == 413
+    mock_validate.assert_not_called()
+
+
 def test_list_files(client: TestClient) -> None:
     """Test listing files."""
     response = client.get("/api/v1/files")
@@ -63,6 +125,42 @@ def test_get_file_not_found(client: TestClient) -> None:
     assert response.status_code == 404
 
 
+def test_get_file_not_modified_for_etag_list(
+    client: TestClient, session: Session
+) -> None:
+    """Test that If-None-Match with a list of ETags gets 304 on any match."""
+    user = User(email="owner@example.com", hashed_password="x")
+    session.add(user)
+    session.commit()
+    now = datetime.now(timezone.utc)
+    file = File(
+        user_id=str(user.id),
+        filename="test.pdf",
+        file_type="pdf",
+        file_size=100,
+        object_name="root/test.pdf",
+        uploaded_at=now,
+        updated_at=now,
+    )
+    session.add(file)
+    session.commit()
+
+    headers = {"Authorization": f"Bearer {create_access_token(user.email)}"}
+    response = client.get(f"/api/v1/files/{file.id}", headers=headers)
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+
+    # Listed among other tags, and as the strong form of the weak tag
+    headers["If-None-Match"] = f'"stale", {etag.removeprefix("W/")}'
+    response = client.get(f"/api/v1/files/{file.id}", headers=headers)
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+
+    headers["If-None-Match"] = '"stale", W/"other"'
+    response = client.get(f"/api/v1/files/{file.id}", headers=headers)
+    assert response.status_code == 200
+
+
 def test_delete_file_not_found(client: TestClient) -> None:
     """Test deleting non-existent file."""
     response = client.delete("/api/v1/files/non-existent-id")
@@ -0,0 +1,52 @@
+"""Tests for user management endpoints."""
+
+from collections.abc import Generator
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.core.database import get_session
+from app.core.security import create_access_token
+from app.main import app
+from app.models.user import User
+
+
+@pytest.fixture
+def session() -> Generator[Session, None, None]:
+    """In-memory database session shared with the app for one test."""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine, tables=[User.__table__])
+    with Session(engine) as session:
+
+        def get_test_session() -> Generator[Session, None, None]:
+            yield session
+
+        app.dependency_overrides[get_session] = get_test_session
+        yield session
+        app.dependency_overrides.pop(get_session, None)
+
+
+def test_delete_user_as_superuser(client: TestClient, session: Session) -> None:
+    """Test that a superuser can delete another user."""
+    admin = User(email="admin@example.com", hashed_password="x", is_superuser=True)
+    other = User(email="other@example.com", hashed_password="x")
+    session.add_all([admin, other])
+    session.commit()
+    other_id = other.id
+
+    headers = {"Authorization": f"Bearer {create_access_token(admin.email)}"}
+    response = client.delete(f"/api/v1/users/{other_id}", headers=headers)
+
+    assert response.status_code == 200
+    assert response.json() == {"message": "User deleted successfully"}
+    assert session.get(User, other_id) is None
+
+    # Now served from the user cache
+    response = client.delete(f"/api/v1/users/{other_id}", headers=headers)
+    assert response.status_code == 404
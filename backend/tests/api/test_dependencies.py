@@ -0,0 +1,53 @@
+"""Tests for shared API dependencies."""
+
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.dependencies import _bearer
+
+
+def test_bearer_reads_token() -> None:
+    """Test extracting the token from a bearer Authorization header."""
+    assert asyncio.run(_bearer("Bearer abc.def")) == "abc.def"
+    assert asyncio.run(_bearer("bearer abc.def")) == "abc.def"
+
+
+@pytest.mark.parametrize("header", [None, "", "Basic abc", "Bearer"])
+def test_bearer_rejects_invalid_header(header: str | None) -> None:
+    """Test that missing or non-bearer headers are rejected."""
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(_bearer(header))
+
+    assert exc_info.value.status_code == 401
+
+
+def test_current_user_resolved_twice_on_one_session() -> None:
+    """Test that cached user lookups reuse the instance already in the session."""
+    from sqlmodel import Session, SQLModel, create_engine
+
+    from app.api.dependencies import (
+        _user_cache,
+        get_current_active_superuser,
+        get_current_active_user,
+    )
+    from app.core.security import create_access_token
+    from app.models.user import User
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine, tables=[User.__table__])
+    with Session(engine) as session:
+        user = User(email="admin@example.com", hashed_password="x", is_superuser=True)
+        session.add(user)
+        session.commit()
+        session.refresh(user)
+        _user_cache.set(user.email, user.model_dump())
+        session.expunge_all()
+
+        token = create_access_token(user.email)
+        superuser = get_current_active_superuser(session, token)
+        current_user = get_current_active_user(session, token)
+
+    assert current_user is superuser
+    _user_cache.pop(user.email)
@@ -0,0 +1,54 @@
+"""Tests for in-process caching utilities."""
+
+import time
+
+from app.core.cache import TTLCache
+
+
+def test_ttl_cache_get_set() -> None:
+    """Test storing and retrieving a value."""
+    cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl=60)
+    cache.set("a", 1)
+
+    assert cache.get("a") == 1
+    assert cache.get("missing") is None
+
+
+def test_ttl_cache_expiry() -> None:
+    """Test that entries expire after their TTL."""
+    cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl=60)
+    cache.set("a", 1, ttl=0.01)
+    time.sleep(0.02)
+
+    assert cache.get("a") is None
+
+
+def test_ttl_cache_non_positive_ttl_not_stored() -> None:
+    """Test that already-expired entries are not stored."""
+    cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl=60)
+    cache.set("a", 1, ttl=-5)
+
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_evicts_least_recently_used() -> None:
+    """Test LRU eviction when maxsize is reached."""
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # "b" is now least recently used
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_pop() -> None:
+    """Test removing a value."""
+    cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl=60)
+    cache.set("a", 1)
+
+    assert cache.pop("a") == 1
+    assert cache.pop("a") is None
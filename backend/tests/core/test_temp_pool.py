@@ -0,0 +1,54 @@
+"""Tests for the reusable temp file pool."""
+
+import os
+import tempfile
+
+from app.core.temp_pool import TempFilePool
+
+
+def test_temp_pool_reuses_released_file() -> None:
+    """Test that a released file is truncated and handed out again."""
+    pool = TempFilePool()
+    path = pool.acquire(".pdf")
+    with open(path, "wb") as f:
+        f.write(b"data")
+    pool.release(path)
+
+    assert pool.acquire(".pdf") == path
+    assert os.path.getsize(path) == 0
+    pool.close()
+
+
+def test_temp_pool_keys_files_by_suffix() -> None:
+    """Test that files are only reused for the same suffix."""
+    pool = TempFilePool()
+    path = pool.acquire(".pdf")
+    pool.release(path)
+
+    other = pool.acquire(".xlsx")
+    assert other != path
+    assert other.endswith(".xlsx")
+    pool.close()
+
+
+def test_temp_pool_limits_free_files() -> None:
+    """Test that files beyond the free-list limit are deleted."""
+    pool = TempFilePool(max_free_per_suffix=1)
+    first, second = pool.acquire(".pdf"), pool.acquire(".pdf")
+    pool.release(first)
+    pool.release(second)
+
+    assert os.path.exists(first)
+    assert not os.path.exists(second)
+    pool.close()
+
+
+def test_temp_pool_deletes_foreign_files() -> None:
+    """Test that releasing a file the pool does not own deletes it."""
+    pool = TempFilePool()
+    temp_fd, temp_path = tempfile.mkstemp()
+    os.close(temp_fd)
+    pool.release(temp_path)
+
+    assert not os.path.exists(temp_path)
+    pool.release(temp_path)  # Missing files are ignored